@@ -0,0 +1,38 @@
+"""Calls per second of Game.available_actions() in each location of a level.
+
+Run with `uv run python benchmarks/bench_available_actions.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from grotten.game import Game
+from grotten.levels import load_level
+
+CALLS = 100_000
+
+
+def main() -> None:
+    for level_number in (1, 2):
+        level = load_level(level_number)
+        print(f"Level {level_number}: {level.name}")
+        for key, location in level.locations.items():
+            game = Game.create(level=level)
+            game.location = location
+            seconds = timeit.timeit(game.available_actions, number=CALLS)
+            print(f"  {key:<12} {CALLS / seconds:12,.0f} calls/s")
+
+        # A location where the game has removed a creature and dropped loot
+        game = Game.create(level=level)
+        location = next(
+            location for location in level.locations.values() if location.creatures
+        )
+        game.location = location
+        game.win_fight(location.creatures[0])
+        seconds = timeit.timeit(game.available_actions, number=CALLS)
+        print(f"  {'(changed)':<12} {CALLS / seconds:12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
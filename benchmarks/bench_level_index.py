@@ -0,0 +1,45 @@
+"""Time to list 10k level files, without and with a warm index.
+
+Run with `uv run python benchmarks/bench_level_index.py`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from grotten.levels.index import get_level_index
+
+LEVELS = 10_000
+
+LEVEL = """
+number = {number}
+name = "Level {number}"
+start = "room"
+
+[locations.room]
+name = "Room"
+description = "An empty room."
+"""
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        level_dir = Path(tmp)
+        for number in range(LEVELS):
+            level_dir.joinpath(f"level_{number}.toml").write_text(
+                LEVEL.format(number=number)
+            )
+
+        for label in ("compile", "cold index", "warm index"):
+            if label == "cold index":
+                (level_dir / "__pycache__" / "index.json").unlink()
+            start = time.perf_counter()
+            levels = get_level_index(level_dir)
+            seconds = time.perf_counter() - start
+            print(f"{label:<12} {len(levels):,} levels in {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
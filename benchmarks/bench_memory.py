@@ -0,0 +1,67 @@
+"""Memory used by a level with 100k locations.
+
+Run with `uv run python benchmarks/bench_memory.py`.
+"""
+
+from __future__ import annotations
+
+import resource
+import time
+import tracemalloc
+
+from grotten.enums import Direction
+from grotten.models import Creature, Item, Level, Location
+
+LOCATIONS = 100_000
+WIDTH = 316
+
+
+def build_level() -> Level:
+    locations: dict[str, Location] = {}
+    for i in range(LOCATIONS):
+        location = Location(
+            name=f"Room {i % 100}",
+            description="A damp room with stone walls.",
+            creatures=(Creature(name="Rat", strength=2),) if i % 10 == 0 else (),
+            items=(Item(name="Dagger", attack_strength=5),) if i % 7 == 0 else (),
+        )
+        if i % WIDTH:
+            location.connect(Direction.WEST, locations[f"room_{i - 1}"])
+        if i >= WIDTH:
+            location.connect(Direction.NORTH, locations[f"room_{i - WIDTH}"])
+        locations[f"room_{i}"] = location
+
+    return Level(
+        number=0,
+        name="Benchmark",
+        start=locations["room_0"],
+        locations=locations,
+        treasure=locations[f"room_{LOCATIONS - 1}"],
+    )
+
+
+def max_rss() -> int:
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> None:
+    rss_before = max_rss()
+    start = time.perf_counter()
+    level = build_level()
+    seconds = time.perf_counter() - start
+    rss_after = max_rss()
+    del level
+
+    tracemalloc.start()
+    level = build_level()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Built {len(level.locations):,} locations in {seconds:.2f} s")
+    print(f"  max RSS: {(rss_after - rss_before) / 2**10:8.1f} MiB increase")
+    print(f"  traced:  {size / 2**20:8.1f} MiB ({size / LOCATIONS:.0f} B/location)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Cost of messages per turn, when read, when dropped unread, and when disabled.
+
+Run with `uv run python benchmarks/bench_messages.py`.
+"""
+
+from __future__ import annotations
+
+import time
+
+from grotten import actions
+from grotten.enums import Direction
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.simulation import RandomPolicy, simulate
+
+TURNS = 200_000
+GAMES = 20_000
+
+
+def walk(game: Game, *, read: bool) -> float:
+    # Walks back and forth between the entrance and the skeletons.
+    west, east = actions.GO[Direction.WEST], actions.GO[Direction.EAST]
+    start = time.perf_counter()
+    for _ in range(TURNS // 2):
+        west.apply(game)
+        east.apply(game)
+        if read:
+            game.messages.pop()
+        else:
+            game.messages.clear()
+    return (time.perf_counter() - start) / TURNS
+
+
+def main() -> None:
+    level = load_level(1)
+    for name, game, read in [
+        ("read", Game.create(level=level), True),
+        ("unread", Game.create(level=level), False),
+        ("quiet", Game.create(level=level, quiet=True), False),
+    ]:
+        print(f"{name:<8} {walk(game, read=read) * 1e6:6.2f} µs/turn")
+
+    start = time.perf_counter()
+    simulate(level, RandomPolicy(), games=GAMES)
+    print(f"simulate {GAMES / (time.perf_counter() - start):8.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
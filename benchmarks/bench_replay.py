@@ -0,0 +1,66 @@
+"""Seeking in the replay of a long session, with and without snapshots.
+
+Run with `uv run python benchmarks/bench_replay.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from grotten.game import Game
+from grotten.journal import JournalWriter, Replay, read_journal
+from grotten.levels import load_level
+
+TURNS = 100_000
+SEEKS = 100
+
+
+def record_session(path: Path) -> None:
+    # Wanders back and forth between the entrance and the skeletons.
+    level = load_level(1)
+    game = Game.create(level=level, seed=0)
+    with JournalWriter.open(path) as journal:
+        journal.start(seed=0, level_number=level.number)
+        for _ in range(TURNS):
+            actions = game.available_actions()
+            index = next(
+                i
+                for i, action in enumerate(actions)
+                if str(action) in {"Go west", "Go east"}
+            )
+            journal.record(index)
+            actions[index].apply(game)
+            game.messages.pop()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.journal"
+
+        start = time.perf_counter()
+        record_session(path)
+        print(f"Recorded {TURNS} turns in {time.perf_counter() - start:.2f} s")
+        print(f"  {path.stat().st_size} bytes")
+
+        start = time.perf_counter()
+        [session] = read_journal(path)
+        print(f"Read in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    rng = random.Random(0)  # noqa: S311
+    turns = [rng.randrange(TURNS + 1) for _ in range(SEEKS)]
+    for interval in (TURNS + 1, 1000):
+        replay = Replay.from_session(session, interval=interval)
+        replay.game_at(TURNS)  # Take all snapshots up front
+
+        start = time.perf_counter()
+        for turn in turns:
+            replay.game_at(turn)
+        seconds = (time.perf_counter() - start) / SEEKS
+        print(f"Seek with interval {interval:6}: {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
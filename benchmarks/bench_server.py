@@ -0,0 +1,102 @@
+"""Turn latency with many concurrent players connected to `grotten serve`.
+
+The server runs in a child process, listening on a Unix socket, while all the
+players are simulated from this process. Each player picks random moves until
+the game ends or it has played TURNS turns.
+
+Run with `uv run python benchmarks/bench_server.py [players]`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from grotten import server
+
+PLAYERS = 1_000
+TURNS = 20
+META_ACTIONS = ("Show inventory", "End game")
+
+
+def run_server(path: str) -> None:
+    async def run() -> None:
+        async with await server.serve(path=path) as listener:
+            await listener.serve_forever()
+
+    asyncio.run(run())
+
+
+async def read_actions(reader: asyncio.StreamReader) -> list[int] | None:
+    actions = []
+    while raw := await reader.readline():
+        line = raw.decode().rstrip("\n")
+        if line == server.PROMPT:
+            return actions
+        if line.startswith("[") and not line.endswith(META_ACTIONS):
+            number = line[1 : line.index("]")]
+            if number.isdigit():
+                actions.append(int(number))
+    return None  # The game is over
+
+
+async def player(path: str, rng: random.Random, latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    actions = await read_actions(reader)
+    for _ in range(TURNS):
+        if not actions:
+            break
+        start = time.perf_counter()
+        writer.write(f"{rng.choice(actions)}\n".encode())
+        actions = await read_actions(reader)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await reader.read()
+
+
+async def run_players(path: str, players: int) -> list[float]:
+    latencies: list[float] = []
+    await asyncio.gather(
+        *(player(path, random.Random(i), latencies) for i in range(players))  # noqa: S311
+    )
+    return latencies
+
+
+def main() -> None:
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else PLAYERS
+
+    # Every player needs a file descriptor on each side of the connection
+    _soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "grotten.sock")
+        process = multiprocessing.Process(target=run_server, args=(path,))
+        process.start()
+        while not Path(path).exists():
+            time.sleep(0.01)
+
+        try:
+            start = time.perf_counter()
+            latencies = asyncio.run(run_players(path, players))
+            seconds = time.perf_counter() - start
+        finally:
+            process.terminate()
+            process.join()
+
+    p50, p99 = (statistics.quantiles(latencies, n=100)[i] for i in (49, 98))
+    print(f"{players} players, {len(latencies)} turns in {seconds:.2f} s")
+    print(f"  {len(latencies) / seconds:10.0f} turns/s")
+    print(f"  p50 {p50 * 1e3:8.2f} ms")
+    print(f"  p99 {p99 * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Session creation time and memory, deep-copied levels vs. shared templates.
+
+Run with `uv run python benchmarks/bench_sessions.py`.
+"""
+
+from __future__ import annotations
+
+import copy
+import timeit
+import tracemalloc
+from functools import partial
+from typing import TYPE_CHECKING
+
+from grotten.game import Game
+from grotten.levels import load_level
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from grotten.models import Level
+
+SESSIONS = 10_000
+
+
+def with_deepcopy(level: Level) -> Game:
+    # How sessions were created before levels became shared templates
+    copied = copy.deepcopy(level)
+    return Game(level=copied, location=copied.start)
+
+
+def with_template(level: Level) -> Game:
+    return Game.create(level=level)
+
+
+def measure_memory(create: Callable[[Level], Game], level: Level) -> float:
+    tracemalloc.start()
+    sessions = [create(level) for _ in range(SESSIONS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return size / SESSIONS
+
+
+def main() -> None:
+    for level_number in (1, 2):
+        level = load_level(level_number)
+        print(f"Level {level_number}: {level.name}")
+        for create in (with_deepcopy, with_template):
+            seconds = timeit.timeit(partial(create, level), number=SESSIONS)
+            memory = measure_memory(create, level)
+            print(
+                f"  {create.__name__:<14}"
+                f" {seconds / SESSIONS * 1e6:8.2f} µs/session"
+                f" {memory:10.0f} B/session"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Snapshot size and round-trip time for a session in the middle of a game.
+
+Run with `uv run python benchmarks/bench_snapshot.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from grotten import snapshot
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.simulation import ScriptedPolicy, Stats, play
+
+NUMBER = 100_000
+SCRIPT = ["Go west", "Pick up Small Sword", "Go north"]
+
+
+def main() -> None:
+    game = Game.create(level=load_level(1), seed=0)
+    play(game, ScriptedPolicy(SCRIPT), Stats(), max_turns=len(SCRIPT))
+
+    for rng in (False, True):
+        data = snapshot.dump(game, rng=rng)
+        dump = timeit.timeit(lambda: snapshot.dump(game, rng=rng), number=NUMBER)  # noqa: B023
+        load = timeit.timeit(lambda: snapshot.load(data), number=NUMBER)  # noqa: B023
+        print(
+            f"rng={rng!s:<5} {len(data):5} bytes"
+            f"  dump {dump / NUMBER * 1e6:6.2f} µs"
+            f"  load {load / NUMBER * 1e6:6.2f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,8 @@
-import gettext
-import importlib.metadata
-from pathlib import Path
+def __getattr__(name: str) -> str:
+    # Looking up package metadata is slow, so only do it when asked to.
+    if name == "__version__":
+        import importlib.metadata  # noqa: PLC0415
 
-__version__ = importlib.metadata.version("grotten")
-
-
-gettext.bindtextdomain("messages", str(Path(__file__).parent / "locale"))
-gettext.textdomain("messages")
+        return importlib.metadata.version("grotten")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
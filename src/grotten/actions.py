@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from gettext import gettext as _
 from typing import TYPE_CHECKING, Protocol
 
+from grotten.enums import Direction
+from grotten.i18n import get_localization
+
 if TYPE_CHECKING:
-    from grotten.enums import Direction
     from grotten.game import Game
+    from grotten.i18n import Localization
     from grotten.models import Creature, Item
 
 
@@ -15,9 +17,12 @@ class Effect(Protocol):
         pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Action:
     def __str__(self) -> str:
+        return self.label(get_localization())
+
+    def label(self, localization: Localization) -> str:
         raise NotImplementedError
 
     def is_meta_action(self) -> bool:
@@ -27,46 +32,52 @@ class Action:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(frozen=True)
 class CustomAction(Action):
     description: str
     effect: Effect
 
-    def __str__(self) -> str:
-        return self.description
+    def label(self, localization: Localization) -> str:
+        return localization.gettext(self.description)
 
     def apply(self, game: Game) -> None:
         self.effect(game)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Go(Action):
     direction: Direction
 
-    def __str__(self) -> str:
-        return _("Go {direction}").format(direction=_(self.direction.value))
+    def label(self, localization: Localization) -> str:
+        return localization.gettext("Go {direction}").format(
+            direction=localization.gettext(self.direction.value)
+        )
 
     def apply(self, game: Game) -> None:
         game.go(self.direction)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Attack(Action):
     creature: Creature
 
-    def __str__(self) -> str:
-        return _("Attack {creature}").format(creature=self.creature.name)
+    def label(self, localization: Localization) -> str:
+        return localization.gettext("Attack {creature}").format(
+            creature=localization.gettext(self.creature.name)
+        )
 
     def apply(self, game: Game) -> None:
         game.attack(self.creature)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PickUp(Action):
     item: Item
 
-    def __str__(self) -> str:
-        return _("Pick up {item}").format(item=self.item.name)
+    def label(self, localization: Localization) -> str:
+        return localization.gettext("Pick up {item}").format(
+            item=localization.gettext(self.item.name)
+        )
 
     def apply(self, game: Game) -> None:
         game.pick_up(self.item)
@@ -75,25 +86,32 @@ class PickUp(Action):
 # --- Meta actions
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetaAction(Action):
     def is_meta_action(self) -> bool:
         return True
 
 
-@dataclass
+@dataclass(frozen=True)
 class EndGame(MetaAction):
-    def __str__(self) -> str:
-        return _("End game")
+    def label(self, localization: Localization) -> str:
+        return localization.gettext("End game")
 
     def apply(self, game: Game) -> None:
         game.end_game()
 
 
-@dataclass
+@dataclass(frozen=True)
 class ShowInventory(MetaAction):
-    def __str__(self) -> str:
-        return _("Show inventory")
+    def label(self, localization: Localization) -> str:
+        return localization.gettext("Show inventory")
 
     def apply(self, game: Game) -> None:
         game.show_inventory()
+
+
+# --- Shared instances of actions that never change
+
+GO = {direction: Go(direction=direction) for direction in Direction}
+SHOW_INVENTORY = ShowInventory()
+END_GAME = EndGame()
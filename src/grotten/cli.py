@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from gettext import gettext as _
-from typing import TYPE_CHECKING
+import contextlib
+import random
+from pathlib import Path  # noqa: TC003 (used by Typer at runtime)
+from typing import TYPE_CHECKING, Annotated
 
 import click
-import rich
 import typer
 
+from grotten import simulation
 from grotten.actions import Action
 from grotten.game import Game
+from grotten.i18n import _
 from grotten.levels import get_levels, load_level
 
 if TYPE_CHECKING:
@@ -18,41 +21,175 @@ if TYPE_CHECKING:
 app = typer.Typer()
 
 
+def rprint(*objects: object, end: str = "\n") -> None:
+    # Rich is slow to import, so we wait until there is something to print.
+    import rich  # noqa: PLC0415
+
+    rich.print(*objects, end=end)
+
+
 @app.command()
-def play() -> None:
-    start_game()
+def play(
+    record: Annotated[
+        Path | None, typer.Option(help="Append the session to this journal.")
+    ] = None,
+) -> None:
+    start_game(record=record)
 
 
 @app.command()
 def levels() -> None:
     levels = get_levels()
 
-    for level in get_levels():
-        rich.print(rf"[yellow]\[{level.number}] ", end="")
-        rich.print(level.name)
+    for level in levels:
+        rprint(rf"[yellow]\[{level.number}] ", end="")
+        rprint(level.name)
 
-    level_number: int = typer.prompt(
+    level_number: str = typer.prompt(
         typer.style(_("Select"), fg="blue"),
-        type=click.IntRange(min=1, max=len(levels)),
+        type=click.Choice([str(level.number) for level in levels]),
+        show_choices=False,
     )
     typer.echo()
 
-    start_game(level_number=level_number)
+    start_game(level_number=int(level_number))
 
 
-def start_game(*, level_number: int = 1) -> None:
-    game = Game.create(level=load_level(level_number))
+@app.command()
+def simulate(  # noqa: PLR0913
+    level: int = 1,
+    games: int = 10_000,
+    policy: Annotated[
+        str,
+        typer.Option(
+            click_type=click.Choice([*simulation.POLICIES, "scripted"]),
+            metavar="[random|greedy|optimal|scripted]",
+        ),
+    ] = "random",
+    script: Annotated[
+        list[str] | None,
+        typer.Option(help="Action to take, once per turn, for the scripted policy."),
+    ] = None,
+    max_turns: int = 100,
+    seed: int = 0,
+    workers: Annotated[
+        int, typer.Option(help="Number of worker processes, 0 for one per core.")
+    ] = 1,
+) -> None:
+    selected: simulation.Policy = (
+        simulation.ScriptedPolicy(script or [])
+        if policy == "scripted"
+        else simulation.POLICIES[policy]()
+    )
+    if workers == 1:
+        stats = simulation.simulate(
+            load_level(level), selected, games=games, seed=seed, max_turns=max_turns
+        )
+    else:
+        stats = simulation.simulate_parallel(
+            level,
+            selected,
+            games=games,
+            seed=seed,
+            max_turns=max_turns,
+            workers=workers or None,
+        )
+
+    rprint(f"[bold]{_('Games')}:[/bold] {stats.games}")
+    rprint(f"[bold]{_('Win rate')}:[/bold] {stats.win_rate:.2%}")
+    rprint(f"[bold]{_('Turns to treasure')}:[/bold] {stats.mean_turns_to_treasure:.1f}")
+    rprint(f"[bold]{_('Deaths')}:[/bold]")
+    for location, deaths in stats.deaths.most_common():
+        rprint(f"  {_(location)}: {deaths}")
+
+
+@app.command()
+def serve(  # noqa: PLR0913
+    host: str = "127.0.0.1",
+    port: int = 4040,
+    socket: Annotated[
+        str | None, typer.Option(help="Listen on a Unix socket instead of TCP.")
+    ] = None,
+    level: int = 1,
+    record: Annotated[
+        Path | None,
+        typer.Option(help="Record each session to a journal in this directory."),
+    ] = None,
+    locale: Annotated[
+        str | None,
+        typer.Option(help="Locale of new sessions, e.g. nb_NO. Players may change it."),
+    ] = None,
+) -> None:
+    import asyncio  # noqa: PLC0415
+
+    from grotten import server  # noqa: PLC0415
+
+    if record is not None:
+        record.mkdir(parents=True, exist_ok=True)
+
+    async def run() -> None:
+        async with await server.serve(
+            host=host,
+            port=port,
+            path=socket,
+            level_number=level,
+            journal_dir=record,
+            locale=locale,
+        ) as listener:
+            await listener.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run())
+
+
+@app.command()
+def replay(
+    path: Path,
+    session: Annotated[int, typer.Option(help="Session in the journal.")] = 0,
+    turn: Annotated[
+        int | None, typer.Option(help="Turn to show, the last one by default.")
+    ] = None,
+) -> None:
+    from grotten.journal import Replay, read_journal  # noqa: PLC0415
+
+    replay = Replay.from_session(read_journal(path)[session])
+    game = replay.game_at(len(replay) if turn is None else turn)
+
+    show_messages(game.messages.pop())
+    rprint(f"[bold]{_('Turn')}:[/bold] {len(replay) if turn is None else turn}")
+    rprint(f"[bold]{_('Location')}:[/bold] {_(game.location.name)}")
+    rprint(f"[bold]{_('Lives')}:[/bold] {game.lives}")
+    rprint(f"[bold]{_('Inventory')}:[/bold] ", end="")
+    rprint(", ".join(_(item.name) for item in game.inventory.items))
+
+
+def start_game(*, level_number: int = 1, record: Path | None = None) -> None:
+    seed = random.getrandbits(63)
+    game = Game.create(level=load_level(level_number), seed=seed)
     game.describe_location()
 
+    journal = None
+    if record is not None:
+        from grotten.journal import JournalWriter  # noqa: PLC0415
+
+        journal = JournalWriter.open(record)
+        journal.start(seed=seed, level_number=level_number)
+
     try:
         while game.running and game.lives > 0:
             typer.clear()
             show_messages(game.messages.pop())
-            action = select_action(game.available_actions())
+            actions = game.available_actions()
+            action = select_action(actions)
+            if journal is not None:
+                journal.record(actions.index(action))
             action.apply(game)
     except typer.Abort:
-        rich.print()
-        rich.print(f"[bold yellow]{_('Aborting')}")
+        rprint()
+        rprint(f"[bold yellow]{_('Aborting')}")
+    finally:
+        if journal is not None:
+            journal.close()
 
     typer.clear()
     show_messages(game.messages.pop())
@@ -60,27 +197,27 @@ def start_game(*, level_number: int = 1) -> None:
 
 def show_messages(messages: list[Message]) -> None:
     for message in messages:
-        rich.print(rf"[magenta]\[{_(message.kind.value)}] ", end="")
-        rich.print(f"[bold]{message.title}")
+        rprint(rf"[magenta]\[{_(message.kind.value)}] ", end="")
+        rprint(f"[bold]{message.title}")
         if message.content is not None:
-            rich.print(message.content)
-        rich.print()
+            rprint(message.content)
+        rprint()
 
 
 def select_action(actions: list[Action]) -> Action:
     typer.secho(_("What do you want to do?"), fg="blue")
 
     for i, action in enumerate(actions, 1):
-        rich.print(rf"[yellow]\[{i}] ", end="")
+        rprint(rf"[yellow]\[{i}] ", end="")
         if action.is_meta_action():
-            rich.print(f"[white]{action}")
+            rprint(f"[white]{action}")
         else:
-            rich.print(str(action))
+            rprint(str(action))
 
     num: int = typer.prompt(
         typer.style(_("Select"), fg="blue"),
         type=click.IntRange(min=1, max=len(actions)),
     )
-    rich.print()
+    rprint()
 
     return actions[num - 1]
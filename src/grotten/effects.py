@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from grotten.actions import Effect
+    from grotten.game import Game
+    from grotten.models import Location
+
+
+def fall_into_pit(game: Game) -> None:
+    game.die()
+    if game.lives > 0:
+        game.restart_level()
+
+
+def teleport(to: Location) -> Effect:
+    def effect(game: Game) -> None:
+        game.location = to
+
+    return effect
+
+
+# Effects that level files can refer to by name. Each factory gets the level's
+# locations by key, so that parameters can refer to other locations.
+EFFECTS: dict[str, Callable[..., Effect]] = {
+    "fall_into_pit": lambda locations: fall_into_pit,  # noqa: ARG005
+    "teleport": lambda locations, to: teleport(to=locations[to]),
+}
+
+
+def make_effect(
+    name: str, locations: Mapping[str, Location], **params: object
+) -> Effect:
+    try:
+        factory = EFFECTS[name]
+    except KeyError:
+        msg = f"Unknown effect: {name!r}"
+        raise ValueError(msg) from None
+    return factory(locations, **params)
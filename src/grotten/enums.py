@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from enum import Enum
-from gettext import gettext as _
+
+from grotten.i18n import N_
 
 
 class Direction(str, Enum):
-    NORTH = _("north")
-    EAST = _("east")
-    SOUTH = _("south")
-    WEST = _("west")
+    NORTH = N_("north")
+    EAST = N_("east")
+    SOUTH = N_("south")
+    WEST = N_("west")
 
     def __neg__(self) -> Direction:
         return {
@@ -20,11 +21,11 @@ class Direction(str, Enum):
 
 
 class Kind(str, Enum):
-    ACTION = _("action")
-    CREATURE = _("creature")
-    GAME = _("game")
-    INVENTORY = _("inventory")
-    ITEM = _("item")
-    LEVEL = _("level")
-    LIFE = _("life")
-    LOCATION = _("location")
+    ACTION = N_("action")
+    CREATURE = N_("creature")
+    GAME = N_("game")
+    INVENTORY = N_("inventory")
+    ITEM = N_("item")
+    LEVEL = N_("level")
+    LIFE = N_("life")
+    LOCATION = N_("location")
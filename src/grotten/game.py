@@ -3,11 +3,10 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from fractions import Fraction
-from gettext import gettext as _
-from gettext import ngettext
+from typing import TYPE_CHECKING
 
-from grotten import actions
-from grotten.enums import Direction, Kind
+from grotten import actions, messages
+from grotten.enums import Direction
 from grotten.levels import load_level
 from grotten.models import (
     Creature,
@@ -16,8 +15,12 @@ from grotten.models import (
     Level,
     Location,
     Mailbox,
+    Overlay,
 )
 
+if TYPE_CHECKING:
+    from grotten.i18n import Localization
+
 
 @dataclass
 class Game:
@@ -27,64 +30,71 @@ class Game:
     lives: int = 3
     running: bool = True
     messages: Mailbox = field(default_factory=Mailbox)
+    overlay: Overlay = field(default_factory=Overlay)
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    # The locale to show the game in, or None for the one from the environment
+    locale: str | None = None
 
     @classmethod
-    def create(cls, *, level: Level | None = None) -> Game:
+    def create(
+        cls,
+        *,
+        level: Level | None = None,
+        seed: int | None = None,
+        quiet: bool = False,
+        locale: str | None = None,
+    ) -> Game:
+        # Quiet games keep no messages, for when nobody is going to read them.
         if level is None:
             level = load_level(1)
-        return cls(level=level, location=level.start)
+        return cls(
+            level=level,
+            location=level.start,
+            messages=Mailbox(enabled=not quiet),
+            rng=random.Random(seed),  # noqa: S311
+            locale=locale,
+        )
+
+    def __post_init__(self) -> None:
+        self.messages.localization = self.level.get_localization(self.locale)
+
+    @property
+    def localization(self) -> Localization:
+        return self.messages.localization
+
+    def set_locale(self, locale: str | None) -> None:
+        # Messages not yet read are shown in the new locale too.
+        self.locale = locale
+        self.messages.localization = self.level.get_localization(locale)
 
     # --- Actions
 
     def available_actions(self) -> list[actions.Action]:
-        return [
-            *self.location.actions,
-            *[
-                actions.Attack(creature=creature)
-                for creature in self.location.creatures
-            ],
-            *[actions.PickUp(item=item) for item in self.location.items],
-            *[
-                actions.Go(direction=direction)
-                for direction in Direction
-                if direction in self.location.neighbors
-            ],
-            actions.ShowInventory(),
-            actions.EndGame(),
-        ]
+        return list(self.overlay.get_action_table(self.location))
 
     def end_game(self) -> None:
         self.running = False
-        self.messages.add(kind=Kind.GAME, title=_("Welcome back"))
+        self.messages.add(messages.WELCOME_BACK)
 
     def go(self, direction: Direction) -> None:
         self.location = self.location.neighbors[direction]
-        self.messages.add(
-            kind=Kind.ACTION,
-            title=_("Going {direction}").format(direction=_(direction.value)),
-        )
+        self.messages.add(messages.GOING, direction=direction.value)
         self.describe_location()
         if self.location.effect is not None:
             self.location.effect(self)
 
     def attack(self, creature: Creature) -> Fraction:
         weapon = self.inventory.get_weapon()
-        winning_odds = Fraction(weapon.attack_strength, creature.strength)
+        winning_odds = self.winning_odds(creature)
         self.messages.add(
-            kind=Kind.ACTION,
-            title=_("Attack {creature}").format(creature=creature.name),
-            content=_(
-                "You attack {creature} ({creature_strength}) "
-                "with {weapon} ({weapon_strength})."
-            ).format(
-                creature=creature.name,
-                creature_strength=creature.strength,
-                weapon=weapon.name,
-                weapon_strength=weapon.attack_strength,
-            ),
+            messages.ATTACK,
+            creature=creature.name,
+            creature_strength=creature.strength,
+            weapon=weapon.name,
+            weapon_strength=weapon.attack_strength,
         )
 
-        won = random.random() < winning_odds  # noqa: S311
+        won = self.rng.random() < winning_odds
 
         if won:
             self.win_fight(creature)
@@ -94,76 +104,51 @@ class Game:
         return winning_odds
 
     def pick_up(self, item: Item) -> None:
-        self.location.items.remove(item)
+        self.overlay.remove_item(self.location, item)
         self.inventory.add(item)
-        self.messages.add(
-            kind=Kind.ACTION,
-            title=_("Picking up {item}").format(item=item.name),
-        )
+        self.messages.add(messages.PICKING_UP, item=item.name)
 
     def show_inventory(self) -> None:
-        if not self.inventory.items:
-            self.messages.add(
-                kind=Kind.INVENTORY,
-                title=_("empty"),
-                content=_("The inventory is empty."),
-            )
+        if not self.inventory:
+            self.messages.add(messages.INVENTORY_EMPTY)
 
         for item in self.inventory.items:
-            self.messages.add(kind=Kind.INVENTORY, title=item.name)
+            self.messages.add(messages.INVENTORY_ITEM, item=item.name)
 
     # --- Action building blocks
 
+    def winning_odds(self, creature: Creature) -> Fraction:
+        weapon = self.inventory.get_weapon()
+        return Fraction(weapon.attack_strength, creature.strength)
+
     def describe_location(self) -> None:
         self.messages.add(
-            kind=Kind.LOCATION,
-            title=self.location.name,
-            content=self.location.description,
+            messages.LOCATION,
+            name=self.location.name,
+            description=self.location.description,
         )
 
-        for creature in self.location.creatures:
-            self.messages.add(kind=Kind.CREATURE, title=creature.name)
+        for creature in self.overlay.get_creatures(self.location):
+            self.messages.add(messages.CREATURE, creature=creature.name)
 
-        for item in self.location.items:
-            self.messages.add(kind=Kind.ITEM, title=item.name)
+        for item in self.overlay.get_items(self.location):
+            self.messages.add(messages.ITEM, item=item.name)
 
     def win_fight(self, creature: Creature) -> None:
-        self.messages.add(
-            kind=Kind.ACTION,
-            title=_("You won"),
-            content=_("You defeated {creature}.").format(creature=creature.name),
-        )
-        self.location.creatures.remove(creature)
-        self.location.items.extend(creature.loot)
+        self.messages.add(messages.WON, creature=creature.name)
+        self.overlay.remove_creature(self.location, creature)
+        self.overlay.add_items(self.location, creature.loot)
 
     def lose_fight(self, creature: Creature) -> None:
-        self.messages.add(
-            kind=Kind.ACTION,
-            title=_("You lost"),
-            content=_("You lost the battle with {creature}.").format(
-                creature=creature.name
-            ),
-        )
+        self.messages.add(messages.LOST, creature=creature.name)
         self.die()
 
     def die(self) -> None:
         self.lives -= 1
-        self.messages.add(
-            kind=Kind.LIFE,
-            title=_("You died"),
-            content=ngettext(
-                _("You have only {lives} life left."),
-                _("You have {lives} lives left."),
-                self.lives,
-            ).format(lives=self.lives),
-        )
+        self.messages.add(messages.DIED, lives=self.lives)
         if self.lives == 0:
-            self.messages.add(kind=Kind.GAME, title=_("Game over"))
+            self.messages.add(messages.GAME_OVER)
 
     def restart_level(self) -> None:
         self.location = self.level.start
-        self.messages.add(
-            kind=Kind.LEVEL,
-            title=_("Restart"),
-            content=_("You respawn at the beginning."),
-        )
+        self.messages.add(messages.RESTART)
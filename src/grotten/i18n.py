@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import functools
+import gettext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+DOMAIN = "messages"
+LOCALE_DIR = Path(__file__).parent / "locale"
+
+# How many catalogs to keep loaded, for servers with players in many locales
+CATALOG_CACHE_SIZE = 16
+
+# Keep the gettext module's own functions working for anyone still using them.
+gettext.bindtextdomain(DOMAIN, str(LOCALE_DIR))
+gettext.textdomain(DOMAIN)
+
+
+@functools.lru_cache(maxsize=CATALOG_CACHE_SIZE)
+def get_translations(locale: str | None = None) -> gettext.NullTranslations:
+    # The gettext module's functions look for the catalog on disk on every
+    # call. We look it up once, and reuse it while it is in use. Without a
+    # locale, it is picked from the environment, e.g. LANG.
+    languages = None if locale is None else [locale]
+    return gettext.translation(DOMAIN, LOCALE_DIR, languages, fallback=True)
+
+
+@dataclass(frozen=True, slots=True)
+class Localization:
+    translations: gettext.NullTranslations
+    # Text that is translated up front, e.g. a level's, to skip the catalog.
+    text: Mapping[str, str] = field(default_factory=dict)
+
+    def gettext(self, message: str) -> str:
+        text = self.text.get(message)
+        if text is None:
+            text = self.translations.gettext(message)
+        return text
+
+    def ngettext(self, singular: str, plural: str, n: int) -> str:
+        return self.translations.ngettext(singular, plural, n)
+
+
+@functools.lru_cache(maxsize=CATALOG_CACHE_SIZE)
+def get_localization(locale: str | None = None) -> Localization:
+    return Localization(translations=get_translations(locale))
+
+
+def _(message: str) -> str:
+    return get_translations().gettext(message)
+
+
+def ngettext(singular: str, plural: str, n: int) -> str:
+    return get_translations().ngettext(singular, plural, n)
+
+
+def N_(message: str) -> str:  # noqa: N802
+    # Marks a message for extraction, to be translated later when it is shown.
+    return message
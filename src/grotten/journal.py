@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Self
+
+from grotten import snapshot
+from grotten.game import Game
+from grotten.levels import load_level
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from grotten.models import Level
+
+# A journal is an append-only file of length-prefixed records, after a short
+# header. A session starts with a START record, holding the seed and level
+# number, followed by an ACTION record per turn, with the index of the chosen
+# action among the available actions. As the game is deterministic given the
+# seed, this is all that is needed to replay the session.
+#
+# Readers skip records of unknown types, and stop at a truncated record at the
+# end of the file, e.g. after a crash.
+
+MAGIC = b"GRTJ"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sH")  # magic, format version
+RECORD = struct.Struct("<BB")  # payload length, record type
+
+START = 1
+START_PAYLOAD = struct.Struct("<qi")  # seed, level number
+
+ACTION = 2
+ACTION_PAYLOAD = struct.Struct("<H")  # action index
+
+_START_RECORD = struct.Struct(RECORD.format + START_PAYLOAD.format[1:])
+_ACTION_RECORD = struct.Struct(RECORD.format + ACTION_PAYLOAD.format[1:])
+
+
+@dataclass
+class JournalWriter:
+    file: BinaryIO
+    # Records are buffered, and written when there is this many bytes of them.
+    batch_size: int = 64 * 1024
+    _buffer: bytearray = field(default_factory=bytearray, repr=False)
+
+    @classmethod
+    def open(cls, path: Path, *, batch_size: int = 64 * 1024) -> JournalWriter:
+        file = path.open("ab")
+        if file.tell() == 0:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+            file.flush()
+        return cls(file=file, batch_size=batch_size)
+
+    def start(self, *, seed: int, level_number: int) -> None:
+        self._buffer += _START_RECORD.pack(
+            START_PAYLOAD.size, START, seed, level_number
+        )
+
+    def record(self, index: int) -> None:
+        self._buffer += _ACTION_RECORD.pack(ACTION_PAYLOAD.size, ACTION, index)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.file.write(self._buffer)
+        self.file.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+@dataclass
+class Session:
+    seed: int
+    level_number: int
+    actions: array[int] = field(default_factory=lambda: array("H"), repr=False)
+
+
+def read_journal(path: Path) -> list[Session]:
+    data = path.read_bytes()
+    if len(data) < HEADER.size or HEADER.unpack_from(data) != (MAGIC, FORMAT_VERSION):
+        msg = f"Not a journal, or from an unsupported version: {path}"
+        raise ValueError(msg)
+
+    sessions: list[Session] = []
+    offset = HEADER.size
+    while offset + RECORD.size <= len(data):
+        length, kind = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if offset + length > len(data):
+            break
+        if kind == ACTION:
+            if not sessions:
+                msg = f"Journal has actions before the first session: {path}"
+                raise ValueError(msg)
+            offset = _read_actions(data, offset - RECORD.size, sessions[-1].actions)
+            continue
+        if kind == START:
+            seed, level_number = START_PAYLOAD.unpack_from(data, offset)
+            sessions.append(Session(seed=seed, level_number=level_number))
+        offset += length
+    return sessions
+
+
+def _read_actions(data: bytes, offset: int, actions: array[int]) -> int:
+    # Reads a run of action records in one go, as they make up almost all of
+    # a journal, and returns the offset after them. All action records are
+    # the same four bytes: length, type, and the two byte index.
+    end = offset + (len(data) - offset) // _ACTION_RECORD.size * _ACTION_RECORD.size
+    lengths = data[offset:end:4]
+    kinds = data[offset + 1 : end : 4]
+    count = min(
+        len(lengths) - len(lengths.lstrip(bytes([ACTION_PAYLOAD.size]))),
+        len(kinds) - len(kinds.lstrip(bytes([ACTION]))),
+    )
+    end = offset + count * _ACTION_RECORD.size
+    words = array("H", data[offset:end])
+    if sys.byteorder == "big":
+        words.byteswap()
+    actions.extend(words[1::2])
+    return end
+
+
+# Rebuilds the game at any turn of a session, by applying the recorded actions.
+# A snapshot is kept every `interval` turns, so that seeking only replays the
+# turns since the closest snapshot before it.
+@dataclass
+class Replay:
+    session: Session
+    level: Level
+    interval: int = 1000
+    snapshots: list[bytes] = field(default_factory=list, repr=False)
+
+    @classmethod
+    def from_session(cls, session: Session, *, interval: int = 1000) -> Replay:
+        level = load_level(session.level_number)
+        return cls(session=session, level=level, interval=interval)
+
+    def __post_init__(self) -> None:
+        if not self.snapshots:
+            game = Game.create(level=self.level, seed=self.session.seed)
+            self.snapshots.append(snapshot.dump(game, rng=True))
+
+    def __len__(self) -> int:
+        return len(self.session.actions)
+
+    def game_at(self, turn: int) -> Game:
+        # Returns the game after `turn` actions, with the messages of the last.
+        actions = self.session.actions
+        if not 0 <= turn <= len(actions):
+            msg = f"Turn {turn} is out of range, the session has {len(actions)} turns"
+            raise ValueError(msg)
+
+        # Snapshots have no messages, so always replay at least the last turn.
+        nearest = min(max(turn - 1, 0) // self.interval, len(self.snapshots) - 1)
+        game = snapshot.load(self.snapshots[nearest], level=self.level)
+        game.messages.enabled = False
+        for current in range(nearest * self.interval, turn):
+            game.messages.enabled = current == turn - 1
+            game.available_actions()[actions[current]].apply(game)
+            done = current + 1
+            if done == len(self.snapshots) * self.interval:
+                self.snapshots.append(snapshot.dump(game, rng=True))
+        game.messages.enabled = True
+        return game
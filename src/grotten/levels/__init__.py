@@ -1,24 +1,35 @@
 from __future__ import annotations
 
-import copy
+import functools
 import pathlib
 from importlib import import_module
 from typing import TYPE_CHECKING
 
+from grotten.levels.cache import load_level_file
+from grotten.levels.index import get_level_index
+
 if TYPE_CHECKING:
-    from grotten.models import Level
+    from grotten.models import Level, LevelInfo
+
+LEVEL_DIR = pathlib.Path(__file__).parent
 
 
-def get_levels() -> list[Level]:
-    level_dir = pathlib.Path(__file__).parent
-    levels: list[Level] = []
-    for level_file in level_dir.glob("level_*.py"):
-        level_number = int(level_file.name.replace("level_", "").replace(".py", ""))
-        levels.append(load_level(level_number))
-    return levels
+def get_levels() -> list[LevelInfo]:
+    # Lists the levels without loading any of them.
+    return get_level_index(LEVEL_DIR)
 
 
 def load_level(level_number: int) -> Level:
+    # Levels are shared, immutable templates. Per-session changes are kept in
+    # the game's overlay, so there is no need to copy the level.
+    path = LEVEL_DIR / f"level_{level_number}.toml"
+    if path.exists():
+        return _load_level_file(path)
     mod = import_module(f".level_{level_number}", __package__)
     level: Level = mod.level
-    return copy.deepcopy(level)
+    return level
+
+
+@functools.cache
+def _load_level_file(path: pathlib.Path) -> Level:
+    return load_level_file(path)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import marshal
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, Any
+
+from grotten.i18n import _
+from grotten.levels.data import build_level, read_level_data
+from grotten.models import LevelInfo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grotten.models import Level
+
+# Level files are compiled to a binary cache, much like Python's .pyc files.
+# The header holds everything needed to list the level, followed by the name,
+# and the level data as a marshalled dict. Listing levels only reads the
+# header from a memory-mapped file, without touching the rest of it.
+
+MAGIC = b"GRTN"
+FORMAT_VERSION = 1
+
+# magic, format version, marshal version, source mtime, source size,
+# level number, name length
+HEADER = struct.Struct("<4sHHqqiH")
+
+
+def get_cache_path(source: Path) -> Path:
+    return source.parent / "__pycache__" / f"{source.stem}.level"
+
+
+def compile_level(source: Path, target: Path) -> None:
+    data = read_level_data(source)
+    build_level(data)  # Fail early on broken level files
+
+    stat = source.stat()
+    name = str(data["name"]).encode()
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        marshal.version,
+        stat.st_mtime_ns,
+        stat.st_size,
+        data["number"],
+        len(name),
+    )
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(header + name + marshal.dumps(data))
+    tmp.replace(target)
+
+
+def read_level_info(source: Path) -> LevelInfo:
+    number, name = read_level_header(source)
+    return LevelInfo(number=number, name=_(name))
+
+
+def read_level_header(source: Path) -> tuple[int, str]:
+    # Returns the level number and the untranslated name.
+    mm = _map_cache(source)
+    if mm is None:
+        data = read_level_data(source)
+        return data["number"], data["name"]
+
+    with mm:
+        number, name, _offset = _read_header(mm)
+    return number, name
+
+
+def load_level_file(source: Path) -> Level:
+    mm = _map_cache(source)
+    if mm is None:
+        return build_level(read_level_data(source))
+
+    with mm:
+        _, _, offset = _read_header(mm)
+        with memoryview(mm)[offset:] as body:
+            data: dict[str, Any] = marshal.loads(body)  # noqa: S302
+    return build_level(data)
+
+
+def _map_cache(source: Path) -> mmap.mmap | None:
+    # Returns None if the cache is stale and can't be written, e.g. because
+    # the levels are installed in a read-only location.
+    target = get_cache_path(source)
+    mm = _map_if_fresh(source, target)
+    if mm is None:
+        try:
+            compile_level(source, target)
+        except OSError:
+            return None
+        mm = _map_if_fresh(source, target)
+    return mm
+
+
+def _map_if_fresh(source: Path, target: Path) -> mmap.mmap | None:
+    try:
+        with target.open("rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):  # ValueError if the file is empty
+        return None
+
+    stat = source.stat()
+    if len(mm) < HEADER.size or HEADER.unpack_from(mm)[:5] != (
+        MAGIC,
+        FORMAT_VERSION,
+        marshal.version,
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        mm.close()
+        return None
+    return mm
+
+
+def _read_header(buffer: mmap.mmap) -> tuple[int, str, int]:
+    # Returns the level number and name, and where the level data starts.
+    *_, number, name_length = HEADER.unpack_from(buffer)
+    end = HEADER.size + name_length
+    return number, buffer[HEADER.size : end].decode(), end
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import tomllib
+from typing import TYPE_CHECKING, Any
+
+from grotten.actions import CustomAction
+from grotten.effects import make_effect
+from grotten.enums import Direction
+from grotten.models import Creature, Item, Level, Location
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from grotten.actions import Effect
+
+# See "Level files" in the README for the file format. Texts are kept as is,
+# and translated per locale by `Level.get_localization()`, just like in the
+# Python levels.
+
+
+def read_level_data(path: Path) -> dict[str, Any]:
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def build_level(data: Mapping[str, Any]) -> Level:
+    specs: Mapping[str, Mapping[str, Any]] = data["locations"]
+
+    locations = {
+        key: Location(
+            name=spec["name"],
+            description=spec.get("description", ""),
+            creatures=tuple(
+                _build_creature(creature) for creature in spec.get("creatures", ())
+            ),
+            items=tuple(_build_item(item) for item in spec.get("items", ())),
+        )
+        for key, spec in specs.items()
+    }
+
+    # Connections and effects may refer to any location, so they are added
+    # once all the locations exist.
+    for key, spec in specs.items():
+        location = locations[key]
+        for direction, neighbor in spec.get("connections", {}).items():
+            location.connect(Direction[direction.upper()], locations[neighbor])
+        if "effect" in spec:
+            location.effect = _build_effect(spec["effect"], locations)
+        location.actions = tuple(
+            CustomAction(
+                description=action["description"],
+                effect=_build_effect(action["effect"], locations),
+            )
+            for action in spec.get("actions", ())
+        )
+
+    treasure = data.get("treasure")
+    return Level(
+        number=data["number"],
+        name=data["name"],
+        start=locations[data["start"]],
+        locations=locations,
+        treasure=locations[treasure] if treasure is not None else None,
+    )
+
+
+def _build_creature(spec: Mapping[str, Any]) -> Creature:
+    return Creature(
+        name=spec["name"],
+        strength=spec.get("strength", 1),
+        loot=tuple(_build_item(item) for item in spec.get("loot", ())),
+    )
+
+
+def _build_item(spec: Mapping[str, Any]) -> Item:
+    return Item(name=spec["name"], attack_strength=spec.get("attack_strength", 0))
+
+
+def _build_effect(
+    spec: str | Mapping[str, Any], locations: Mapping[str, Location]
+) -> Effect:
+    if isinstance(spec, str):
+        return make_effect(spec, locations)
+    params = dict(spec)
+    return make_effect(params.pop("name"), locations, **params)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tomllib
+from pathlib import Path
+
+from grotten.i18n import _
+from grotten.levels.cache import read_level_header
+from grotten.models import LevelInfo
+
+# The level index lists levels without loading them. Python levels are listed
+# in the manifest. Level files are listed from their compiled headers, and the
+# result is kept in an index file, so that we don't have to open every level
+# file on each run.
+
+INDEX_VERSION = 1
+
+# Each level file is indexed by name, with its mtime, size, number and name.
+
+
+def get_level_index(level_dir: Path) -> list[LevelInfo]:
+    entries = [
+        *_read_manifest(level_dir / "manifest.toml"),
+        *_scan_level_files(level_dir),
+    ]
+    entries.sort()
+    return [LevelInfo(number, _(name)) for number, name in entries]
+
+
+def _read_manifest(path: Path) -> list[tuple[int, str]]:
+    try:
+        with path.open("rb") as f:
+            manifest = tomllib.load(f)
+    except FileNotFoundError:
+        return []
+    return [(level["number"], level["name"]) for level in manifest["levels"]]
+
+
+def _scan_level_files(level_dir: Path) -> list[tuple[int, str]]:
+    index_path = level_dir / "__pycache__" / "index.json"
+    with contextlib.suppress(OSError):
+        index_path.parent.mkdir(exist_ok=True)
+
+    # Like Python's own import system, trust the index as long as the
+    # directory's mtime is unchanged, without looking at every file.
+    dir_mtime = level_dir.stat().st_mtime_ns
+    cached_mtime, cached = _read_index(index_path)
+    if cached_mtime == dir_mtime:
+        return [(number, name) for _mtime, _size, number, name in cached.values()]
+
+    index: dict[str, tuple[int, int, int, str]] = {}
+    for entry in os.scandir(level_dir):
+        if not (entry.name.startswith("level_") and entry.name.endswith(".toml")):
+            continue
+        stat = entry.stat()
+        cached_entry = cached.get(entry.name)
+        if cached_entry is not None and cached_entry[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            index[entry.name] = cached_entry
+        else:
+            number, name = read_level_header(Path(entry.path))
+            index[entry.name] = (stat.st_mtime_ns, stat.st_size, number, name)
+
+    _write_index(index_path, dir_mtime, index)
+    return [(number, name) for _mtime, _size, number, name in index.values()]
+
+
+def _read_index(path: Path) -> tuple[int | None, dict[str, tuple[int, int, int, str]]]:
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None, {}
+    if data.get("version") != INDEX_VERSION:
+        return None, {}
+    return data["mtime"], {
+        name: (mtime, size, number, level_name)
+        for name, (mtime, size, number, level_name) in data["levels"].items()
+    }
+
+
+def _write_index(
+    path: Path, dir_mtime: int, index: dict[str, tuple[int, int, int, str]]
+) -> None:
+    # The index is only a cache, so failing to write it is fine.
+    data = {"version": INDEX_VERSION, "mtime": dir_mtime, "levels": index}
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data))
+        tmp.replace(path)
+    except OSError:
+        pass
@@ -1,51 +1,41 @@
 from __future__ import annotations
 
-from gettext import gettext as _
-from typing import TYPE_CHECKING
-
+from grotten.effects import fall_into_pit
 from grotten.enums import Direction
+from grotten.i18n import N_
 from grotten.models import Creature, Item, Level, Location
 
-if TYPE_CHECKING:
-    from grotten.game import Game
-
-
-# Effects
-def fall_into_pit(game: Game) -> None:
-    game.die()
-    if game.lives > 0:
-        game.restart_level()
-
-
 # Locations
 entrance = Location(
-    name=_("Entrance"),
-    description=_("You find yourself in a dark and scary cave."),
+    name=N_("Entrance"),
+    description=N_("You find yourself in a dark and scary cave."),
 )
 pit = Location(
-    name=_("Pit"),
-    description=_("You fell into a deep dark pit."),
+    name=N_("Pit"),
+    description=N_("You fell into a deep dark pit."),
     effect=fall_into_pit,
 )
 skeletons = Location(
-    name=_("Skeletons"),
-    description=_("You stumble upon the skeletons of three humans and a dog."),
-    items=[Item(name=_("Small Sword"), attack_strength=8)],
+    name=N_("Skeletons"),
+    description=N_("You stumble upon the skeletons of three humans and a dog."),
+    items=(Item(name=N_("Small Sword"), attack_strength=8),),
 )
 dragon_lair = Location(
-    name=_("Dragon lair"),
-    description=_("There is large green dragon sleeping on the floor in front of you."),
-    creatures=[
+    name=N_("Dragon lair"),
+    description=N_(
+        "There is large green dragon sleeping on the floor in front of you."
+    ),
+    creatures=(
         Creature(
-            name=_("Green Dragon"),
+            name=N_("Green Dragon"),
             strength=12,
-            loot=[Item(name=_("Dragon tooth")), Item(name=_("Dragon tooth"))],
-        )
-    ],
+            loot=(Item(name=N_("Dragon tooth")), Item(name=N_("Dragon tooth"))),
+        ),
+    ),
 )
 treasure = Location(
-    name=_("Treasure"),
-    description=_("You found the treasure!"),
+    name=N_("Treasure"),
+    description=N_("You found the treasure!"),
 )
 
 
@@ -59,7 +49,7 @@ dragon_lair.connect(Direction.NORTH, treasure)
 # Level
 level = Level(
     number=1,
-    name=_("Dragon lair"),
+    name=N_("Dragon lair"),
     start=entrance,
     locations={
         "entrance": entrance,
@@ -68,4 +58,5 @@ level = Level(
         "dragon_lair": dragon_lair,
         "treasure": treasure,
     },
+    treasure=treasure,
 )
@@ -1,70 +1,57 @@
 from __future__ import annotations
 
-from gettext import gettext as _
-from typing import TYPE_CHECKING
-
-from grotten.actions import CustomAction, Effect
+from grotten.actions import CustomAction
+from grotten.effects import teleport
 from grotten.enums import Direction
+from grotten.i18n import N_
 from grotten.models import Creature, Item, Level, Location
 
-if TYPE_CHECKING:
-    from grotten.game import Game
-
-
-# Effects
-def teleport(to: Location) -> Effect:
-    def effect(game: Game) -> None:
-        game.location = to
-
-    return effect
-
-
 # Locations
 bedroom = Location(
-    name=_("Bedroom"),
-    description=_("You're in an dusty bedroom with stone walls."),
+    name=N_("Bedroom"),
+    description=N_("You're in an dusty bedroom with stone walls."),
 )
 weaponry = Location(
-    name=_("Weaponry"),
-    description=_("This looks like a looted and abandoned weaponry."),
-    items=[
-        Item(name=_("Wooden Bow"), attack_strength=10),
-        Item(name=_("Arrow")),
-        Item(name=_("Arrow")),
-    ],
+    name=N_("Weaponry"),
+    description=N_("This looks like a looted and abandoned weaponry."),
+    items=(
+        Item(name=N_("Wooden Bow"), attack_strength=10),
+        Item(name=N_("Arrow")),
+        Item(name=N_("Arrow")),
+    ),
 )
 hallway = Location(
-    name=_("Hallway"),
-    description=_("A long hallway of badly lit portraits of old grumpy men."),
+    name=N_("Hallway"),
+    description=N_("A long hallway of badly lit portraits of old grumpy men."),
 )
 bird_cages = Location(
-    name=_("Bird cages"),
-    description=_(
+    name=N_("Bird cages"),
+    description=N_(
         "There is a number of gigantic bird cages along the stone wall. "
         "All of them are empty, some with the door unhinged."
     ),
-    creatures=[
-        Creature(name=_("Giant Moa"), strength=8),
-        Creature(name=_("Spotted Kiwi"), strength=2),
-        Creature(name=_("Ostrich"), strength=5),
-    ],
+    creatures=(
+        Creature(name=N_("Giant Moa"), strength=8),
+        Creature(name=N_("Spotted Kiwi"), strength=2),
+        Creature(name=N_("Ostrich"), strength=5),
+    ),
 )
 portal = Location(
-    name=_("Portal room"),
-    description=_(
+    name=N_("Portal room"),
+    description=N_(
         "The hallway widens into a large room. "
         "In the middle there is a strange mirror with a surface that seems to wobble."
     ),
-    actions=[
+    actions=(
         CustomAction(
-            description=_("Touch the wobbling mirror"),
+            description=N_("Touch the wobbling mirror"),
             effect=teleport(to=bird_cages),
         ),
-    ],
+    ),
 )
 treasure = Location(
-    name=_("Treasure"),
-    description=_("You found the treasure!"),
+    name=N_("Treasure"),
+    description=N_("You found the treasure!"),
 )
 
 # Connections
@@ -77,7 +64,7 @@ bird_cages.connect(Direction.EAST, treasure)
 # Level
 level = Level(
     number=2,
-    name=_("Bird cages"),
+    name=N_("Bird cages"),
     start=bedroom,
     locations={
         "bedroom": bedroom,
@@ -87,4 +74,5 @@ level = Level(
         "bird_cages": bird_cages,
         "treasure": treasure,
     },
+    treasure=treasure,
 )
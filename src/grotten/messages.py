@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from grotten.enums import Kind
+from grotten.i18n import N_
+from grotten.models import Template
+
+# All the messages of the game. Arguments with level text, like the names of
+# locations and creatures, are looked up in the level's translations.
+
+WELCOME_BACK = Template(Kind.GAME, N_("Welcome back"))
+GAME_OVER = Template(Kind.GAME, N_("Game over"))
+
+GOING = Template(Kind.ACTION, N_("Going {direction}"), translate_args=("direction",))
+ATTACK = Template(
+    Kind.ACTION,
+    N_("Attack {creature}"),
+    N_(
+        "You attack {creature} ({creature_strength}) with {weapon} ({weapon_strength})."
+    ),
+    translate_args=("creature", "weapon"),
+)
+PICKING_UP = Template(Kind.ACTION, N_("Picking up {item}"), translate_args=("item",))
+WON = Template(
+    Kind.ACTION,
+    N_("You won"),
+    N_("You defeated {creature}."),
+    translate_args=("creature",),
+)
+LOST = Template(
+    Kind.ACTION,
+    N_("You lost"),
+    N_("You lost the battle with {creature}."),
+    translate_args=("creature",),
+)
+
+INVENTORY_EMPTY = Template(Kind.INVENTORY, N_("empty"), N_("The inventory is empty."))
+INVENTORY_ITEM = Template(
+    Kind.INVENTORY, "{item}", translate_args=("item",), translate=False
+)
+
+LOCATION = Template(
+    Kind.LOCATION,
+    "{name}",
+    "{description}",
+    translate_args=("name", "description"),
+    translate=False,
+)
+CREATURE = Template(
+    Kind.CREATURE, "{creature}", translate_args=("creature",), translate=False
+)
+ITEM = Template(Kind.ITEM, "{item}", translate_args=("item",), translate=False)
+
+DIED = Template(
+    Kind.LIFE,
+    N_("You died"),
+    N_("You have only {lives} life left."),
+    plural=N_("You have {lives} lives left."),
+    count="lives",
+)
+RESTART = Template(Kind.LEVEL, N_("Restart"), N_("You respawn at the beginning."))
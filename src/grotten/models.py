@@ -1,43 +1,81 @@
 from __future__ import annotations
 
+import bisect
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from gettext import gettext as _
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, cast
+
+from grotten import actions
+from grotten.enums import Direction
+from grotten.i18n import N_, Localization, get_localization, get_translations
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from grotten.actions import Action
-    from grotten.enums import Direction, Kind
+    from grotten.enums import Kind
     from grotten.game import Game
 
 
-@dataclass(order=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Creature:
     name: str
     strength: int = 1
-    loot: list[Item] = field(default_factory=list)
+    loot: tuple[Item, ...] = ()
 
 
-@dataclass(order=True)
+@dataclass(order=True, frozen=True, slots=True)
 class Item:
     name: str
     attack_strength: int = 0
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Location:
     name: str
     description: str = field(repr=False)
     neighbors: dict[Direction, Location] = field(default_factory=dict, repr=False)
-    actions: list[Action] = field(default_factory=list, repr=False)
-    creatures: list[Creature] = field(default_factory=list, repr=False)
-    items: list[Item] = field(default_factory=list, repr=False)
+    actions: tuple[Action, ...] = field(default=(), repr=False)
+    creatures: tuple[Creature, ...] = field(default=(), repr=False)
+    items: tuple[Item, ...] = field(default=(), repr=False)
     effect: Callable[[Game], None] | None = field(default=None, repr=False)
+    _action_table: tuple[Action, ...] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        # Generated levels repeat the same few names and descriptions a lot.
+        self.name = sys.intern(self.name)
+        self.description = sys.intern(self.description)
 
     def connect(self, direction: Direction, neighbor: Location) -> None:
         self.neighbors[direction] = neighbor
         neighbor.neighbors[-direction] = self
+        self._action_table = neighbor._action_table = None
+
+    def get_action_table(self) -> tuple[Action, ...]:
+        # Built on first use, as locations are connected after they are created.
+        if self._action_table is None:
+            self._action_table = self.build_action_table(self.creatures, self.items)
+        return self._action_table
+
+    def build_action_table(
+        self, creatures: Iterable[Creature], items: Iterable[Item]
+    ) -> tuple[Action, ...]:
+        return (
+            *self.actions,
+            *[actions.Attack(creature=creature) for creature in creatures],
+            *[actions.PickUp(item=item) for item in items],
+            *[
+                actions.GO[direction]
+                for direction in Direction
+                if direction in self.neighbors
+            ],
+            actions.SHOW_INVENTORY,
+            actions.END_GAME,
+        )
 
 
 @dataclass
@@ -46,45 +84,258 @@ class Level:
     name: str
     start: Location = field(repr=False)
     locations: dict[str, Location] = field(default_factory=dict, repr=False)
+    treasure: Location | None = field(default=None, repr=False)
+    _ids: LevelIds | None = field(default=None, init=False, repr=False, compare=False)
+    _localizations: dict[str | None, Localization] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_ids(self) -> LevelIds:
+        if self._ids is None:
+            self._ids = LevelIds.build(self)
+        return self._ids
+
+    def get_localization(self, locale: str | None = None) -> Localization:
+        # The level's text is translated once per locale, and shared by all
+        # sessions playing the level in that locale.
+        localization = self._localizations.get(locale)
+        if localization is None:
+            translations = get_translations(locale)
+            text = {message: translations.gettext(message) for message in self.texts()}
+            localization = self._localizations[locale] = Localization(
+                translations=translations, text=MappingProxyType(text)
+            )
+        return localization
+
+    def texts(self) -> set[str]:
+        texts = {self.name, BARE_HANDS.name}
+        for location in self.locations.values():
+            texts.update((location.name, location.description))
+            for creature in location.creatures:
+                texts.add(creature.name)
+                texts.update(item.name for item in creature.loot)
+            texts.update(item.name for item in location.items)
+            texts.update(
+                action.description
+                for action in location.actions
+                if isinstance(action, actions.CustomAction)
+            )
+        return texts
+
+
+# Stable integer ids for the locations, creatures, and items of a level, so that
+# they can be referred to from outside the process, e.g. in snapshots. Creatures
+# and items are numbered in sorted order, which does not depend on how the level
+# was built.
+@dataclass(frozen=True)
+class LevelIds:
+    locations: tuple[Location, ...]
+    creatures: tuple[Creature, ...]
+    items: tuple[Item, ...]
+    location_ids: dict[Location, int] = field(repr=False)
+    creature_ids: dict[Creature, int] = field(repr=False)
+    item_ids: dict[Item, int] = field(repr=False)
+
+    @classmethod
+    def build(cls, level: Level) -> LevelIds:
+        locations = tuple(level.locations.values())
+        creatures = tuple(
+            sorted({creature for loc in locations for creature in loc.creatures})
+        )
+        items = tuple(
+            sorted(
+                {
+                    BARE_HANDS,
+                    *[item for loc in locations for item in loc.items],
+                    *[item for creature in creatures for item in creature.loot],
+                }
+            )
+        )
+        return cls(
+            locations=locations,
+            creatures=creatures,
+            items=items,
+            location_ids={location: i for i, location in enumerate(locations)},
+            creature_ids={creature: i for i, creature in enumerate(creatures)},
+            item_ids={item: i for i, item in enumerate(items)},
+        )
+
+
+@dataclass(slots=True)
+class LevelInfo:
+    number: int
+    name: str
+
+
+# Per-session changes on top of a shared level. Locations are only copied into
+# the overlay the first time their creatures or items change.
+@dataclass
+class Overlay:
+    creatures: dict[Location, tuple[Creature, ...]] = field(default_factory=dict)
+    items: dict[Location, tuple[Item, ...]] = field(default_factory=dict)
+    action_tables: dict[Location, tuple[Action, ...]] = field(default_factory=dict)
+
+    def get_creatures(self, location: Location) -> tuple[Creature, ...]:
+        return self.creatures.get(location, location.creatures)
+
+    def get_items(self, location: Location) -> tuple[Item, ...]:
+        return self.items.get(location, location.items)
+
+    def get_action_table(self, location: Location) -> tuple[Action, ...]:
+        if location not in self.creatures and location not in self.items:
+            return location.get_action_table()
+        table = self.action_tables.get(location)
+        if table is None:
+            table = self.action_tables[location] = location.build_action_table(
+                self.get_creatures(location), self.get_items(location)
+            )
+        return table
+
+    def remove_creature(self, location: Location, creature: Creature) -> None:
+        creatures = list(self.get_creatures(location))
+        creatures.remove(creature)
+        self.creatures[location] = tuple(creatures)
+        self.action_tables.pop(location, None)
+
+    def remove_item(self, location: Location, item: Item) -> None:
+        items = list(self.get_items(location))
+        items.remove(item)
+        self.items[location] = tuple(items)
+        self.action_tables.pop(location, None)
+
+    def add_items(self, location: Location, items: Iterable[Item]) -> None:
+        self.items[location] = (*self.get_items(location), *items)
+        self.action_tables.pop(location, None)
+
+    def copy(self) -> Overlay:
+        return Overlay(
+            creatures=dict(self.creatures),
+            items=dict(self.items),
+            action_tables=dict(self.action_tables),
+        )
+
+
+BARE_HANDS = Item(N_("Bare Hands"), attack_strength=3)
 
 
 @dataclass
 class Inventory:
-    items: list[Item] = field(default_factory=list)
+    # Distinct items in sorted order, and how many there are of each.
+    stacks: list[Item] = field(default_factory=list)
+    counts: dict[Item, int] = field(default_factory=dict)
+    weapon: Item = BARE_HANDS
+
+    @property
+    def items(self) -> list[Item]:
+        return [item for item in self.stacks for _ in range(self.counts[item])]
 
     def add(self, item: Item) -> None:
-        self.items = sorted([*self.items, item])
+        count = self.counts.get(item, 0)
+        if count == 0:
+            bisect.insort(self.stacks, item)
+        self.counts[item] = count + 1
+
+        # Prefer the strongest weapon, and the first in sorted order on ties.
+        weapon = self.weapon
+        if item.attack_strength > weapon.attack_strength or (
+            weapon is not BARE_HANDS
+            and item.attack_strength == weapon.attack_strength
+            and item < weapon
+        ):
+            self.weapon = item
 
     def get_weapon(self) -> Item:
-        best_weapon = Item(_("Bare Hands"), attack_strength=3)
-        for item in self.items:
-            if item.attack_strength > best_weapon.attack_strength:
-                best_weapon = item
-        return best_weapon
+        return self.weapon
 
+    def copy(self) -> Inventory:
+        return Inventory(
+            stacks=list(self.stacks), counts=dict(self.counts), weapon=self.weapon
+        )
 
-@dataclass
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self.counts
+
+
+@dataclass(frozen=True, slots=True)
 class Message:
     kind: Kind
     title: str
     content: str | None = None
 
 
+# A message with placeholders for its arguments. Templates are localized and
+# formatted only when the message is read.
+@dataclass(frozen=True, slots=True)
+class Template:
+    kind: Kind
+    title: str
+    content: str | None = None
+    # Plural form of the content, picked by the argument named by `count`
+    plural: str | None = None
+    count: str | None = None
+    # Arguments that are localized too, like directions and level text
+    translate_args: tuple[str, ...] = ()
+    # Whether the title and content are localized, and not just placeholders
+    translate: bool = True
+
+    def render(self, args: dict[str, object], localization: Localization) -> Message:
+        gettext = localization.gettext
+        title, content = self.title, self.content
+        if self.translate:
+            title = gettext(title)
+            if content is not None and self.plural is not None:
+                count = cast("int", args[self.count or ""])
+                content = localization.ngettext(content, self.plural, count)
+            elif content is not None:
+                content = gettext(content)
+        if self.translate_args:
+            args = dict(args)
+            for key in self.translate_args:
+                args[key] = gettext(cast("str", args[key]))
+        return Message(
+            self.kind,
+            title.format_map(args),
+            None if content is None else content.format_map(args),
+        )
+
+
+MAILBOX_SIZE = 100
+
+
 @dataclass
 class Mailbox:
-    messages: list[Message] = field(default_factory=list)
+    # A ring buffer of templates and their arguments, dropping the oldest
+    # messages when full. Nothing is kept while disabled, e.g. in simulations.
+    entries: deque[tuple[Template, dict[str, object]]] = field(
+        default_factory=lambda: deque(maxlen=MAILBOX_SIZE)
+    )
+    enabled: bool = True
+    localization: Localization = field(default_factory=get_localization, repr=False)
 
-    def add(self, *, kind: Kind, title: str, content: str | None = None) -> Message:
-        message = Message(kind=kind, title=title, content=content)
-        self.messages.append(message)
-        return message
+    def add(self, template: Template, /, **args: object) -> None:
+        if self.enabled:
+            self.entries.append((template, args))
 
     def pop(self) -> list[Message]:
-        messages, self.messages = self.messages, []
+        messages = self.messages
+        self.entries.clear()
         return messages
 
+    def clear(self) -> None:
+        self.entries.clear()
+
+    @property
+    def messages(self) -> list[Message]:
+        return [
+            template.render(args, self.localization) for template, args in self.entries
+        ]
+
     def __len__(self) -> int:
-        return len(self.messages)
+        return len(self.entries)
 
     def __getitem__(self, index: int) -> Message:
-        return self.messages[index]
+        template, args = self.entries[index]
+        return template.render(args, self.localization)
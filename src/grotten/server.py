@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import uuid
+from typing import TYPE_CHECKING
+
+from grotten.game import Game
+from grotten.journal import JournalWriter
+from grotten.levels import load_level
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grotten.actions import Action
+    from grotten.i18n import Localization
+    from grotten.models import Message
+
+# A simple line protocol, playable with e.g. `nc` or `telnet`:
+#
+# - The server sends the messages of the turn and the numbered list of
+#   available actions, followed by a line with just PROMPT.
+# - The client answers with a line holding the number of its chosen action.
+# - The client may also switch the session to another locale, with a line like
+#   "locale nb_NO". The server then sends the actions again, in that locale.
+# - When the game is over, the server sends the last messages and closes the
+#   connection.
+
+PROMPT = ">"
+DEFAULT_PORT = 4040
+
+# asyncio's default backlog of 100 pending connections is easily overrun when
+# many players connect at once.
+BACKLOG = 4096
+
+
+async def serve(  # noqa: PLR0913
+    *,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    path: str | None = None,
+    level_number: int = 1,
+    journal_dir: Path | None = None,
+    locale: str | None = None,
+) -> asyncio.Server:
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await play_session(
+            reader,
+            writer,
+            level_number=level_number,
+            journal_dir=journal_dir,
+            locale=locale,
+        )
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle, path=path, backlog=BACKLOG)
+    return await asyncio.start_server(handle, host=host, port=port, backlog=BACKLOG)
+
+
+async def play_session(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    level_number: int = 1,
+    journal_dir: Path | None = None,
+    locale: str | None = None,
+) -> None:
+    # Each session is recorded to its own journal, if enabled. Sessions are
+    # always seeded, so that they can be replayed from their journal.
+    seed = random.getrandbits(63)
+    game = Game.create(level=load_level(level_number), seed=seed, locale=locale)
+    game.describe_location()
+
+    journal = None
+    if journal_dir is not None:
+        journal = JournalWriter.open(journal_dir / f"{uuid.uuid4().hex}.journal")
+        journal.start(seed=seed, level_number=level_number)
+
+    try:
+        while game.running and game.lives > 0:
+            actions = game.available_actions()
+            writer.write(
+                render_turn(game.messages.pop(), actions, game.localization).encode()
+            )
+            await writer.drain()
+
+            index = await read_action(reader, writer, game, actions)
+            if index is None:
+                return  # The client disconnected
+            if journal is not None:
+                journal.record(index)
+            actions[index].apply(game)
+
+        writer.write(render_messages(game.messages.pop(), game.localization).encode())
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        if journal is not None:
+            journal.close()
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def read_action(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    game: Game,
+    actions: list[Action],
+) -> int | None:
+    # Returns the index of the chosen action, or None on disconnect.
+    while line := await reader.readline():
+        command, _, locale = line.decode(errors="replace").strip().partition(" ")
+        if command == "locale":
+            game.set_locale(locale or None)
+            writer.write(render_turn([], actions, game.localization).encode())
+            await writer.drain()
+            continue
+
+        try:
+            num = int(command)
+        except ValueError:
+            num = 0
+        if 1 <= num <= len(actions):
+            return num - 1
+        select = game.localization.gettext("Select")
+        writer.write(f"{select} 1-{len(actions)}\n{PROMPT}\n".encode())
+        await writer.drain()
+    return None
+
+
+def render_turn(
+    messages: list[Message], actions: list[Action], localization: Localization
+) -> str:
+    lines = [localization.gettext("What do you want to do?")]
+    lines.extend(
+        f"[{i}] {action.label(localization)}" for i, action in enumerate(actions, 1)
+    )
+    lines.append(PROMPT)
+    return render_messages(messages, localization) + "\n".join(lines) + "\n"
+
+
+def render_messages(messages: list[Message], localization: Localization) -> str:
+    lines: list[str] = []
+    for message in messages:
+        kind = localization.gettext(message.kind.value)
+        lines.append(f"[{kind}] {message.title}")
+        if message.content is not None:
+            lines.append(message.content)
+        lines.append("")
+    return "".join(f"{line}\n" for line in lines)
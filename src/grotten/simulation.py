@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import TYPE_CHECKING, Protocol
+
+from grotten.actions import Action, Attack, EndGame, Go, PickUp
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.solver import Solver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from grotten.models import Level, Location
+
+
+class Policy(Protocol):
+    def choose(self, game: Game, available: list[Action], turn: int) -> Action:
+        pass
+
+
+@dataclass
+class RandomPolicy:
+    def choose(self, game: Game, available: list[Action], turn: int) -> Action:  # noqa: ARG002
+        return game.rng.choice(_playable(available))
+
+
+@dataclass
+class ScriptedPolicy:
+    # Descriptions of the actions to take, one per turn, e.g. "Go west".
+    script: Sequence[str]
+
+    def choose(self, game: Game, available: list[Action], turn: int) -> Action:  # noqa: ARG002
+        if turn < len(self.script):
+            for action in available:
+                if str(action) == self.script[turn]:
+                    return action
+        return _end_game(available)
+
+
+@dataclass
+class GreedyPolicy:
+    # Attack when the odds of winning are at least this good.
+    min_odds: Fraction = Fraction(1, 2)
+
+    def choose(self, game: Game, available: list[Action], turn: int) -> Action:  # noqa: ARG002
+        for action in available:
+            if isinstance(action, PickUp):
+                return action
+
+        attacks = [
+            (game.winning_odds(action.creature), action)
+            for action in available
+            if isinstance(action, Attack)
+        ]
+        best_attack = max(attacks, key=lambda attack: attack[0], default=None)
+        if best_attack is not None and best_attack[0] >= self.min_odds:
+            return best_attack[1]
+
+        moves = [
+            action for action in _playable(available) if not isinstance(action, Attack)
+        ]
+        if moves:
+            return game.rng.choice(moves)
+        if best_attack is not None:
+            return best_attack[1]
+        return _end_game(available)
+
+
+@dataclass
+class OptimalPolicy:
+    solver: Solver = field(default_factory=Solver, repr=False)
+
+    def choose(self, game: Game, available: list[Action], turn: int) -> Action:  # noqa: ARG002
+        return self.solver.best_action(game) or _end_game(available)
+
+
+POLICIES: dict[str, Callable[[], Policy]] = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "optimal": OptimalPolicy,
+}
+
+
+@dataclass
+class Stats:
+    games: int = 0
+    wins: int = 0
+    deaths: Counter[str] = field(default_factory=Counter)
+    turns_to_treasure: Counter[int] = field(default_factory=Counter)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_turns_to_treasure(self) -> float:
+        if not self.wins:
+            return 0.0
+        total = sum(turns * count for turns, count in self.turns_to_treasure.items())
+        return total / self.wins
+
+    def merge(self, other: Stats) -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.deaths.update(other.deaths)
+        self.turns_to_treasure.update(other.turns_to_treasure)
+
+
+def simulate(
+    level: Level,
+    policy: Policy,
+    *,
+    games: int,
+    seed: int = 0,
+    max_turns: int = 100,
+) -> Stats:
+    # Each game gets its own seed, so any range of games can be replayed alone.
+    stats = Stats()
+    for game_seed in range(seed, seed + games):
+        game = Game.create(level=level, seed=game_seed, quiet=True)
+        play(game, policy, stats, max_turns=max_turns)
+    return stats
+
+
+def simulate_parallel(  # noqa: PLR0913
+    level_number: int,
+    policy: Policy,
+    *,
+    games: int,
+    seed: int = 0,
+    max_turns: int = 100,
+    workers: int | None = None,
+) -> Stats:
+    # The seed range is split in chunks that are simulated in worker processes.
+    # As every game is seeded by its position in the range, the merged result
+    # is the same no matter how many workers are used.
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-games // (workers * 4)))
+    chunks = [
+        (start, min(chunk_size, seed + games - start))
+        for start in range(seed, seed + games, chunk_size)
+    ]
+
+    stats = Stats()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _simulate_chunk, level_number, policy, start, size, max_turns
+            )
+            for start, size in chunks
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def _simulate_chunk(
+    level_number: int, policy: Policy, seed: int, games: int, max_turns: int
+) -> Stats:
+    level = load_level(level_number)
+    return simulate(level, policy, games=games, seed=seed, max_turns=max_turns)
+
+
+def play(game: Game, policy: Policy, stats: Stats, *, max_turns: int = 100) -> None:
+    treasure = game.level.treasure
+    stats.games += 1
+
+    for turn in range(max_turns):
+        if not game.running or game.lives <= 0:
+            return
+
+        action = policy.choose(game, game.available_actions(), turn)
+        lives = game.lives
+        target = _target(game.location, action)
+        action.apply(game)
+        game.messages.clear()
+
+        if game.lives < lives:
+            stats.deaths[target.name] += 1
+        if game.location is treasure:
+            stats.wins += 1
+            stats.turns_to_treasure[turn + 1] += 1
+            return
+
+
+def _target(location: Location, action: Action) -> Location:
+    # Deaths are counted where the action leads, e.g. in the pit you fell into.
+    if isinstance(action, Go):
+        return location.neighbors[action.direction]
+    return location
+
+
+def _playable(available: list[Action]) -> list[Action]:
+    return [action for action in available if not action.is_meta_action()] or [
+        _end_game(available)
+    ]
+
+
+def _end_game(available: list[Action]) -> Action:
+    return next(action for action in available if isinstance(action, EndGame))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import random
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.models import Inventory, Overlay
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from grotten.models import Level, Location
+
+# A snapshot only holds a session's changes on top of the shared level, with
+# everything in the level referred to by its id from `Level.get_ids()`:
+#
+# - The header, with the level number, location, lives, and whether the game
+#   is running.
+# - An array of 32-bit words with the inventory and the overlay:
+#   weapon, number of stacks, (item, count) per stack,
+#   number of locations with changed creatures, (location, n, creature * n)
+#   per location, and the same for items.
+# - Optionally the state of the random number generator.
+#
+# Messages are not included, so pop them before taking a snapshot. Effects
+# belong to the level, and are restored along with it.
+
+MAGIC = b"GRTS"
+FORMAT_VERSION = 1
+
+FLAG_RNG = 1
+
+# magic, format version, flags, level number, location, lives, running,
+# number of words
+HEADER = struct.Struct("<4sBBiIh?I")
+
+# Mersenne Twister state and position, and the cached next gauss value
+RNG_STATE = struct.Struct("<625I?d")
+
+
+def dump(game: Game, *, rng: bool = False) -> bytes:
+    ids = game.level.get_ids()
+    item_ids = ids.item_ids
+    inventory = game.inventory
+
+    words = [item_ids[inventory.weapon], len(inventory.stacks)]
+    for item in inventory.stacks:
+        words += (item_ids[item], inventory.counts[item])
+    _dump_changes(words, game.overlay.creatures, ids.location_ids, ids.creature_ids)
+    _dump_changes(words, game.overlay.items, ids.location_ids, item_ids)
+
+    body = array("I", words)
+    if sys.byteorder == "big":
+        body.byteswap()
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        FLAG_RNG if rng else 0,
+        game.level.number,
+        ids.location_ids[game.location],
+        game.lives,
+        game.running,
+        len(words),
+    )
+    if not rng:
+        return header + body.tobytes()
+
+    _version, state, gauss_next = game.rng.getstate()
+    return (
+        header
+        + body.tobytes()
+        + RNG_STATE.pack(*state, gauss_next is not None, gauss_next or 0.0)
+    )
+
+
+def load(data: bytes, *, level: Level | None = None) -> Game:
+    if len(data) < HEADER.size:
+        msg = "Snapshot is truncated"
+        raise ValueError(msg)
+    magic, version, flags, number, location, lives, running, size = HEADER.unpack_from(
+        data
+    )
+    if magic != MAGIC or version != FORMAT_VERSION:
+        msg = "Not a snapshot, or from an unsupported version"
+        raise ValueError(msg)
+
+    if level is None:
+        level = load_level(number)
+    elif level.number != number:
+        msg = f"Snapshot is for level {number}, not level {level.number}"
+        raise ValueError(msg)
+    ids = level.get_ids()
+
+    end = HEADER.size + size * 4
+    if len(data) < end + (RNG_STATE.size if flags & FLAG_RNG else 0):
+        msg = "Snapshot is truncated"
+        raise ValueError(msg)
+    body = array("I")
+    body.frombytes(data[HEADER.size : end])
+    if sys.byteorder == "big":
+        body.byteswap()
+    words = iter(body)
+
+    items = ids.items
+    weapon = items[next(words)]
+    stacks = []
+    counts = {}
+    for _ in range(next(words)):
+        item = items[next(words)]
+        stacks.append(item)
+        counts[item] = next(words)
+
+    overlay = Overlay(
+        creatures=_load_changes(words, ids.locations, ids.creatures),
+        items=_load_changes(words, ids.locations, items),
+    )
+
+    rng = random.Random()  # noqa: S311
+    if flags & FLAG_RNG:
+        *state, has_gauss, gauss_next = RNG_STATE.unpack_from(data, end)
+        rng.setstate((3, tuple(state), gauss_next if has_gauss else None))
+
+    return Game(
+        level=level,
+        location=ids.locations[location],
+        inventory=Inventory(stacks=stacks, counts=counts, weapon=weapon),
+        lives=lives,
+        running=running,
+        overlay=overlay,
+        rng=rng,
+    )
+
+
+def _dump_changes(
+    words: list[int],
+    changes: dict[Location, tuple[Any, ...]],
+    location_ids: dict[Location, int],
+    ids: dict[Any, int],
+) -> None:
+    words.append(len(changes))
+    for location, things in changes.items():
+        words += (location_ids[location], len(things))
+        words += [ids[thing] for thing in things]
+
+
+def _load_changes(
+    words: Iterator[int], locations: tuple[Location, ...], things: tuple[Any, ...]
+) -> dict[Location, tuple[Any, ...]]:
+    changes: dict[Location, tuple[Any, ...]] = {}
+    for _ in range(next(words)):
+        location = locations[next(words)]
+        changes[location] = tuple(things[next(words)] for _ in range(next(words)))
+    return changes
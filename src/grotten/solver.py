@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+from grotten.actions import Action, Attack
+from grotten.game import Game
+from grotten.models import Mailbox
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from grotten.models import Creature, Level, Location
+
+# The state space of a level is split in "worlds": everything about a game
+# except where the player is. Within a world, actions only move the player
+# around. Every other action makes progress, by costing a life, defeating a
+# creature or picking up an item, and can never lead back to an earlier world.
+# This lets us solve one world at a time, recursing into the worlds reachable
+# from it, with the exact odds of each fight.
+
+
+@dataclass
+class Solution:
+    win_probability: Fraction
+    solver: Solver = field(repr=False)
+
+    def best_action(self, game: Game) -> Action | None:
+        return self.solver.best_action(game)
+
+
+@dataclass
+class Solver:
+    values: dict[tuple[Location, Hashable], Fraction] = field(
+        default_factory=dict, repr=False
+    )
+    policy: dict[tuple[Location, Hashable], Action | None] = field(
+        default_factory=dict, repr=False
+    )
+    _solving: set[Hashable] = field(default_factory=set, repr=False)
+
+    def best_action(self, game: Game) -> Action | None:
+        self.win_probability(game)
+        return self.policy[state_key(game)]
+
+    def win_probability(self, game: Game) -> Fraction:
+        key = state_key(game)
+        if key in self.values:
+            return self.values[key]
+
+        if game.location is game.level.treasure:
+            value, best_action = Fraction(1), None
+        elif game.lives <= 0 or not game.running:
+            value, best_action = Fraction(0), None
+        else:
+            value, best_action = self._solve_world(game)
+
+        self.values[key] = value
+        self.policy[key] = best_action
+        return value
+
+    def _solve_world(self, game: Game) -> tuple[Fraction, Action | None]:
+        world = world_key(game)
+        if world in self._solving:
+            msg = f"Level {game.level.name!r} has effects that undo progress"
+            raise ValueError(msg)
+        self._solving.add(world)
+
+        best: tuple[Fraction, Action | None] = (Fraction(0), None)
+
+        # Breadth-first search over the locations reachable within this world,
+        # remembering the first action taken to get to each of them.
+        queue: deque[tuple[Game, Action | None]] = deque([(game, None)])
+        seen = {game.location}
+        while queue:
+            current, first_action = queue.popleft()
+            if current.location is current.level.treasure:
+                best = (Fraction(1), first_action)
+                break
+
+            for action in current.available_actions():
+                if action.is_meta_action():
+                    continue
+                if isinstance(action, Attack):
+                    value = self._attack(current, action.creature)
+                else:
+                    after = fork(current)
+                    action.apply(after)
+                    if world_key(after) == world:
+                        if after.location not in seen:
+                            seen.add(after.location)
+                            queue.append((after, first_action or action))
+                        continue
+                    value = self.win_probability(after)
+                if value > best[0]:
+                    best = (value, first_action or action)
+
+        self._solving.remove(world)
+        return best
+
+    def _attack(self, game: Game, creature: Creature) -> Fraction:
+        odds = min(game.winning_odds(creature), Fraction(1))
+
+        won = fork(game)
+        won.win_fight(creature)
+        lost = fork(game)
+        lost.lose_fight(creature)
+
+        value = odds * self.win_probability(won)
+        if odds < 1:
+            value += (1 - odds) * self.win_probability(lost)
+        return value
+
+
+def solve(level: Level, *, lives: int = 3) -> Solution:
+    solver = Solver()
+    game = Game(level=level, location=level.start, lives=lives)
+    return Solution(win_probability=solver.win_probability(game), solver=solver)
+
+
+def state_key(game: Game) -> tuple[Location, Hashable]:
+    return (game.location, world_key(game))
+
+
+def world_key(game: Game) -> Hashable:
+    return (
+        game.lives,
+        game.running,
+        frozenset(game.overlay.creatures.items()),
+        frozenset(game.overlay.items.items()),
+        frozenset(game.inventory.counts.items()),
+    )
+
+
+def fork(game: Game) -> Game:
+    # Messages are not kept, as nobody is going to read them.
+    return Game(
+        level=game.level,
+        location=game.location,
+        inventory=game.inventory.copy(),
+        lives=game.lives,
+        running=game.running,
+        messages=Mailbox(enabled=False),
+        overlay=game.overlay.copy(),
+        rng=game.rng,
+    )
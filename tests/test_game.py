@@ -13,6 +13,25 @@ def test_loads_level_1_by_default():
     assert game.location == game.level.start
 
 
+def test_create_with_seed(level_1):
+    def fight(seed):
+        game = Game.create(level=level_1, seed=seed)
+        game.location = level_1.locations["dragon_lair"]
+        game.attack(game.location.creatures[0])
+        return game.lives
+
+    assert [fight(seed) for seed in range(20)] == [fight(seed) for seed in range(20)]
+
+
+def test_create_quiet(level_1):
+    game = Game.create(level=level_1, quiet=True)
+
+    game.go(Direction.WEST)
+
+    assert game.location.name == "Skeletons"
+    assert len(game.messages) == 0
+
+
 def test_available_actions(game):
     result = game.available_actions()
 
@@ -122,15 +141,29 @@ def test_pick_up(game, level_1):
     game.location = level_1.locations["skeletons"]
     item = game.location.items[0]
 
-    assert len(game.location.items) == 1
+    assert len(game.overlay.get_items(game.location)) == 1
     assert len(game.inventory.items) == 0
 
     game.pick_up(item)
 
-    assert len(game.location.items) == 0
+    assert len(game.overlay.get_items(game.location)) == 0
     assert len(game.inventory.items) == 1
     assert item in game.inventory.items
 
+    # The shared level template is left untouched
+    assert len(game.location.items) == 1
+
+
+def test_pick_up_does_not_affect_other_games(game, level_1):
+    other = Game.create(level=level_1)
+    game.location = level_1.locations["skeletons"]
+    item = game.location.items[0]
+
+    game.pick_up(item)
+
+    assert game.overlay.get_items(game.location) == ()
+    assert other.overlay.get_items(game.location) == (item,)
+
 
 def test_show_inventory_when_empty(game):
     game.show_inventory()
@@ -158,15 +191,19 @@ def test_win_fight(game, level_1):
     game.location = level_1.locations["dragon_lair"]
     game.inventory.add(Item(name="sword", attack_strength=8))
     creature = game.location.creatures[0]
-    assert len(game.location.items) == 0
+    assert len(game.overlay.get_items(game.location)) == 0
 
     game.win_fight(creature)
 
     assert game.messages[0].title == "You won"
-    assert creature not in game.location.creatures
-    assert game.location.items == [
+    assert creature not in game.overlay.get_creatures(game.location)
+    assert game.overlay.get_items(game.location) == (
         Item(name="Dragon tooth"),
         Item(name="Dragon tooth"),
+    )
+    assert game.available_actions()[:2] == [
+        actions.PickUp(item=Item(name="Dragon tooth")),
+        actions.PickUp(item=Item(name="Dragon tooth")),
     ]
 
 
@@ -0,0 +1,70 @@
+import pytest
+
+from grotten import actions
+from grotten.enums import Direction
+from grotten.game import Game
+from grotten.i18n import _, get_translations, ngettext
+
+
+def test_translations_are_cached():
+    assert get_translations() is get_translations()
+
+
+def test_untranslated_messages_fall_back_to_english():
+    assert _("Go {direction}") == "Go {direction}"
+    assert ngettext("{n} life", "{n} lives", 2) == "{n} lives"
+
+
+def test_catalogs_are_cached_per_locale():
+    assert get_translations("nb_NO") is get_translations("nb_NO")
+    assert get_translations("nb_NO") is not get_translations("en")
+
+
+def test_level_is_translated_once_per_locale(level_1):
+    localization = level_1.get_localization("nb_NO")
+
+    assert level_1.get_localization("nb_NO") is localization
+    assert localization.text["Entrance"] == "Inngang"
+    assert localization.text["Green Dragon"] == "Grønn drage"
+    assert localization.gettext("Dragon lair") == "Dragereir"
+
+
+def test_level_text_is_read_only(level_1):
+    with pytest.raises(TypeError):
+        level_1.get_localization("nb_NO").text["Entrance"] = "Inngang"  # type: ignore[index]
+
+
+def test_sessions_have_their_own_locale(level_1):
+    english = Game.create(level=level_1, locale="en")
+    norwegian = Game.create(level=level_1, locale="nb_NO")
+
+    for game in (english, norwegian):
+        game.go(Direction.WEST)
+
+    assert [message.title for message in english.messages.pop()] == [
+        "Going west",
+        "Skeletons",
+        "Small Sword",
+    ]
+    assert [message.title for message in norwegian.messages.pop()] == [
+        "Går vestover",
+        "Skjelett",
+        "Lite sverd",
+    ]
+
+
+def test_set_locale_translates_unread_messages(level_1):
+    game = Game.create(level=level_1, locale="en")
+    game.describe_location()
+
+    game.set_locale("nb_NO")
+
+    assert game.messages[0].title == "Inngang"
+
+
+def test_action_labels(level_1):
+    localization = level_1.get_localization("nb_NO")
+    creature = level_1.locations["dragon_lair"].creatures[0]
+
+    assert actions.Attack(creature=creature).label(localization) == "Angrip Grønn drage"
+    assert actions.GO[Direction.NORTH].label(localization) == "Gå nordover"
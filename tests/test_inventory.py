@@ -0,0 +1,71 @@
+import pytest
+
+from grotten.models import BARE_HANDS, Inventory, Item
+
+
+@pytest.fixture
+def inventory():
+    return Inventory()
+
+
+def test_empty(inventory):
+    assert not inventory
+    assert inventory.items == []
+    assert inventory.get_weapon() is BARE_HANDS
+
+
+def test_items_are_sorted(inventory):
+    inventory.add(Item(name="Sword", attack_strength=8))
+    inventory.add(Item(name="Arrow"))
+    inventory.add(Item(name="Bow", attack_strength=10))
+
+    assert inventory.items == [
+        Item(name="Arrow"),
+        Item(name="Bow", attack_strength=10),
+        Item(name="Sword", attack_strength=8),
+    ]
+
+
+def test_duplicates_are_stacked(inventory):
+    inventory.add(Item(name="Dragon tooth"))
+    inventory.add(Item(name="Dragon tooth"))
+
+    assert len(inventory) == 2
+    assert inventory.stacks == [Item(name="Dragon tooth")]
+    assert inventory.counts == {Item(name="Dragon tooth"): 2}
+    assert inventory.items == [Item(name="Dragon tooth"), Item(name="Dragon tooth")]
+    assert Item(name="Dragon tooth") in inventory
+
+
+def test_weak_items_are_not_weapons(inventory):
+    inventory.add(Item(name="Arrow"))
+    inventory.add(Item(name="Stick", attack_strength=3))
+
+    assert inventory.get_weapon() is BARE_HANDS
+
+
+def test_strongest_item_is_the_weapon(inventory):
+    inventory.add(Item(name="Sword", attack_strength=8))
+    inventory.add(Item(name="Bow", attack_strength=10))
+    inventory.add(Item(name="Dagger", attack_strength=5))
+
+    assert inventory.get_weapon() == Item(name="Bow", attack_strength=10)
+
+
+def test_weapon_does_not_depend_on_pickup_order(inventory):
+    inventory.add(Item(name="Sword", attack_strength=8))
+    inventory.add(Item(name="Axe", attack_strength=8))
+
+    assert inventory.get_weapon() == Item(name="Axe", attack_strength=8)
+
+
+def test_copy(inventory):
+    inventory.add(Item(name="Arrow"))
+
+    other = inventory.copy()
+    other.add(Item(name="Arrow"))
+    other.add(Item(name="Sword", attack_strength=8))
+
+    assert len(inventory) == 1
+    assert inventory.get_weapon() is BARE_HANDS
+    assert len(other) == 3
@@ -0,0 +1,127 @@
+from array import array
+
+import pytest
+
+from grotten import snapshot
+from grotten.game import Game
+from grotten.journal import HEADER, JournalWriter, Replay, Session, read_journal
+
+SCRIPT = [
+    "Go west",
+    "Pick up Small Sword",
+    *["Go east", "Go west"] * 1000,
+    "Go north",
+    "Attack Green Dragon",
+]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "game.journal"
+
+
+def record(journal, level, seed, script):
+    # Plays the script, and returns a snapshot of the game after each turn.
+    game = Game.create(level=level, seed=seed)
+    journal.start(seed=seed, level_number=level.number)
+    snapshots = [snapshot.dump(game, rng=True)]
+    for description in script:
+        actions = game.available_actions()
+        index = [str(action) for action in actions].index(description)
+        journal.record(index)
+        actions[index].apply(game)
+        snapshots.append(snapshot.dump(game, rng=True))
+    return snapshots
+
+
+def test_write_and_read(path, level_1):
+    with JournalWriter.open(path) as journal:
+        record(journal, level_1, 42, ["Go west", "Pick up Small Sword"])
+        record(journal, level_1, 43, ["Go north"])
+
+    sessions = read_journal(path)
+
+    assert sessions == [
+        Session(seed=42, level_number=1, actions=array("H", [1, 0])),
+        Session(seed=43, level_number=1, actions=array("H", [0])),
+    ]
+
+
+def test_writes_in_batches(path):
+    journal = JournalWriter.open(path, batch_size=90)
+
+    # 14 bytes to start the session and 4 bytes per action
+    journal.start(seed=42, level_number=1)
+    for _ in range(18):
+        journal.record(0)
+    assert path.stat().st_size == HEADER.size
+
+    journal.record(0)
+    assert path.stat().st_size == HEADER.size + 90
+
+    journal.record(0)
+    journal.close()
+    assert path.stat().st_size == HEADER.size + 94
+
+
+def test_appends_to_existing_journal(path, level_1):
+    for seed in (1, 2):
+        with JournalWriter.open(path) as journal:
+            record(journal, level_1, seed, ["Go west"])
+
+    assert [session.seed for session in read_journal(path)] == [1, 2]
+
+
+def test_ignores_truncated_record(path, level_1):
+    with JournalWriter.open(path) as journal:
+        record(journal, level_1, 42, ["Go west", "Pick up Small Sword"])
+    path.write_bytes(path.read_bytes()[:-1])
+
+    assert list(read_journal(path)[0].actions) == [1]
+
+
+def test_rejects_other_files(path):
+    path.write_bytes(b"nope")
+
+    with pytest.raises(ValueError, match="Not a journal"):
+        read_journal(path)
+
+
+def test_replay_matches_recorded_game(path, level_1):
+    with JournalWriter.open(path) as journal:
+        snapshots = record(journal, level_1, 42, SCRIPT)
+    replay = Replay.from_session(read_journal(path)[0], interval=100)
+
+    assert len(replay) == len(SCRIPT)
+    for turn in (len(SCRIPT), 0, 1, 100, 101, 1234, len(SCRIPT) - 1):
+        assert snapshot.dump(replay.game_at(turn), rng=True) == snapshots[turn]
+
+
+def test_replay_keeps_snapshots(path, level_1):
+    with JournalWriter.open(path) as journal:
+        record(journal, level_1, 42, SCRIPT)
+    replay = Replay.from_session(read_journal(path)[0], interval=100)
+
+    replay.game_at(550)
+
+    assert len(replay.snapshots) == 6
+
+
+def test_replay_has_messages_of_last_turn(path, level_1):
+    with JournalWriter.open(path) as journal:
+        record(journal, level_1, 42, SCRIPT)
+    replay = Replay.from_session(read_journal(path)[0], interval=100)
+    replay.game_at(300)
+
+    game = replay.game_at(200)
+
+    assert game.messages[0].title == "Going west"
+
+
+def test_replay_out_of_range(path, level_1):
+    with JournalWriter.open(path) as journal:
+        record(journal, level_1, 42, ["Go west"])
+    replay = Replay.from_session(read_journal(path)[0])
+
+    with pytest.raises(ValueError, match="out of range"):
+        replay.game_at(2)
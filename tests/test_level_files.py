@@ -0,0 +1,159 @@
+import pytest
+
+from grotten import levels
+from grotten.effects import fall_into_pit
+from grotten.enums import Direction
+from grotten.game import Game
+from grotten.levels.cache import (
+    compile_level,
+    get_cache_path,
+    load_level_file,
+    read_level_info,
+)
+from grotten.levels.data import build_level, read_level_data
+from grotten.models import Item, LevelInfo
+
+LEVEL = """
+number = 7
+name = "Mirror maze"
+start = "entrance"
+treasure = "treasure"
+
+[locations.entrance]
+name = "Entrance"
+description = "A cold entrance."
+connections = { north = "pit", west = "armory" }
+
+[locations.pit]
+name = "Pit"
+description = "A deep pit."
+effect = "fall_into_pit"
+
+[locations.armory]
+name = "Armory"
+description = "Racks of old weapons."
+connections = { north = "mirror" }
+
+[[locations.armory.items]]
+name = "Spear"
+attack_strength = 9
+
+[locations.mirror]
+name = "Mirror"
+description = "A wobbling mirror."
+
+[[locations.mirror.creatures]]
+name = "Troll"
+strength = 10
+loot = [{ name = "Troll tooth" }]
+
+[[locations.mirror.actions]]
+description = "Touch the mirror"
+effect = { name = "teleport", to = "treasure" }
+
+[locations.treasure]
+name = "Treasure"
+description = "You found the treasure!"
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "level_7.toml"
+    path.write_text(LEVEL)
+    return path
+
+
+def test_build_level(source):
+    level = build_level(read_level_data(source))
+
+    assert level.number == 7
+    assert level.name == "Mirror maze"
+    assert level.start is level.locations["entrance"]
+    assert level.treasure is level.locations["treasure"]
+
+    entrance = level.locations["entrance"]
+    assert entrance.neighbors == {
+        Direction.NORTH: level.locations["pit"],
+        Direction.WEST: level.locations["armory"],
+    }
+    assert level.locations["pit"].neighbors == {Direction.SOUTH: entrance}
+    assert level.locations["pit"].effect is fall_into_pit
+    assert level.locations["armory"].items == (Item(name="Spear", attack_strength=9),)
+
+    (troll,) = level.locations["mirror"].creatures
+    assert troll.strength == 10
+    assert troll.loot == (Item(name="Troll tooth"),)
+
+
+def test_custom_action_effect(source):
+    level = build_level(read_level_data(source))
+    game = Game.create(level=level)
+    game.location = level.locations["mirror"]
+
+    (action,) = game.location.actions
+    action.apply(game)
+
+    assert str(action) == "Touch the mirror"
+    assert game.location is level.treasure
+
+
+def test_unknown_effect(source):
+    data = read_level_data(source)
+    data["locations"]["pit"]["effect"] = "explode"
+
+    with pytest.raises(ValueError, match="Unknown effect: 'explode'"):
+        build_level(data)
+
+
+def test_compile_and_read_info(source):
+    target = get_cache_path(source)
+    compile_level(source, target)
+
+    assert target.exists()
+    assert read_level_info(source) == LevelInfo(number=7, name="Mirror maze")
+
+
+def test_load_level_file_compiles_cache(source):
+    level = load_level_file(source)
+
+    assert get_cache_path(source).exists()
+    assert level.name == "Mirror maze"
+    assert set(level.locations) == {
+        "entrance",
+        "pit",
+        "armory",
+        "mirror",
+        "treasure",
+    }
+
+
+def test_stale_cache_is_recompiled(source):
+    assert read_level_info(source).name == "Mirror maze"
+
+    source.write_text(LEVEL.replace("Mirror maze", "Broken mirrors"))
+
+    assert read_level_info(source).name == "Broken mirrors"
+    assert load_level_file(source).name == "Broken mirrors"
+
+
+def test_read_only_cache_falls_back_to_source(source, monkeypatch):
+    def fail(source, target):
+        raise PermissionError
+
+    monkeypatch.setattr("grotten.levels.cache.compile_level", fail)
+
+    assert read_level_info(source) == LevelInfo(number=7, name="Mirror maze")
+    assert load_level_file(source).name == "Mirror maze"
+    assert not get_cache_path(source).exists()
+
+
+def test_levels_from_files_are_listed_and_loaded(source, monkeypatch):
+    monkeypatch.setattr(levels, "LEVEL_DIR", source.parent)
+
+    assert levels.get_levels() == [LevelInfo(number=7, name="Mirror maze")]
+
+    level = levels.load_level(7)
+
+    assert level.name == "Mirror maze"
+    assert levels.load_level(7) is level
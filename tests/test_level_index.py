@@ -0,0 +1,72 @@
+import pytest
+
+from grotten.levels import LEVEL_DIR, load_level
+from grotten.levels.index import get_level_index
+from grotten.models import LevelInfo
+
+LEVEL = """
+number = {number}
+name = "{name}"
+start = "room"
+
+[locations.room]
+name = "Room"
+"""
+
+
+def write_level(path, number, name):
+    path.joinpath(f"level_{number}.toml").write_text(
+        LEVEL.format(number=number, name=name)
+    )
+
+
+@pytest.fixture
+def level_dir(tmp_path):
+    write_level(tmp_path, 4, "Four")
+    write_level(tmp_path, 3, "Three")
+    return tmp_path
+
+
+def test_bundled_manifest():
+    assert get_level_index(LEVEL_DIR)[:2] == [
+        LevelInfo(number=1, name="Dragon lair"),
+        LevelInfo(number=2, name="Bird cages"),
+    ]
+
+
+def test_manifest_matches_level_modules():
+    for info in get_level_index(LEVEL_DIR):
+        level = load_level(info.number)
+        assert (level.number, level.name) == (info.number, info.name)
+
+
+def test_level_files_are_indexed(level_dir):
+    assert get_level_index(level_dir) == [
+        LevelInfo(number=3, name="Three"),
+        LevelInfo(number=4, name="Four"),
+    ]
+    assert (level_dir / "__pycache__" / "index.json").exists()
+
+
+def test_index_is_reused(level_dir, monkeypatch):
+    get_level_index(level_dir)
+
+    def fail(source):
+        raise AssertionError(source)
+
+    monkeypatch.setattr("grotten.levels.index.read_level_header", fail)
+
+    assert len(get_level_index(level_dir)) == 2
+
+
+def test_index_is_updated(level_dir):
+    get_level_index(level_dir)
+
+    write_level(level_dir, 3, "Three again")
+    (level_dir / "level_4.toml").unlink()
+    write_level(level_dir, 5, "Five")
+
+    assert get_level_index(level_dir) == [
+        LevelInfo(number=3, name="Three again"),
+        LevelInfo(number=5, name="Five"),
+    ]
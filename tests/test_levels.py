@@ -1,5 +1,5 @@
-from grotten.levels import load_level
-from grotten.models import Level, Location
+from grotten.levels import get_levels, load_level
+from grotten.models import Level, LevelInfo, Location
 
 
 def test_load_level():
@@ -11,4 +11,12 @@ def test_load_level():
 
     other = load_level(1)
 
-    assert level is not other
+    # Levels are shared templates, never copied per session
+    assert level is other
+
+
+def test_get_levels():
+    assert get_levels() == [
+        LevelInfo(number=1, name="Dragon lair"),
+        LevelInfo(number=2, name="Bird cages"),
+    ]
@@ -1,5 +1,6 @@
 import pytest
 
+from grotten import actions
 from grotten.enums import Direction
 from grotten.models import Location
 
@@ -25,3 +26,25 @@ def test_connect(bedroom, bathroom):
 
     assert bedroom.neighbors == {Direction.NORTH: bathroom}
     assert bathroom.neighbors == {Direction.SOUTH: bedroom}
+
+
+def test_action_table(bedroom, bathroom):
+    bedroom.connect(Direction.NORTH, bathroom)
+
+    table = bedroom.get_action_table()
+
+    assert table == (
+        actions.GO[Direction.NORTH],
+        actions.SHOW_INVENTORY,
+        actions.END_GAME,
+    )
+    assert bedroom.get_action_table() is table
+
+
+def test_connect_invalidates_action_table(bedroom, bathroom):
+    bedroom.get_action_table()
+
+    bedroom.connect(Direction.NORTH, bathroom)
+
+    assert actions.GO[Direction.NORTH] in bedroom.get_action_table()
+    assert actions.GO[Direction.SOUTH] in bathroom.get_action_table()
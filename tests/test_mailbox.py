@@ -1,7 +1,19 @@
+import dataclasses
+
 import pytest
 
-from grotten.enums import Kind
-from grotten.models import Mailbox, Message
+from grotten.enums import Direction, Kind
+from grotten.models import MAILBOX_SIZE, Mailbox, Message, Template
+
+GREETING = Template(Kind.GAME, "Hello {name}", "Some content")
+GOING = Template(Kind.ACTION, "Going {direction}", translate_args=("direction",))
+LIVES = Template(
+    Kind.LIFE,
+    "Lives",
+    "{lives} life left",
+    plural="{lives} lives left",
+    count="lives",
+)
 
 
 @pytest.fixture
@@ -10,18 +22,77 @@ def mailbox():
 
 
 def test_add(mailbox):
-    mailbox.add(kind=Kind.GAME, title="A title", content="Some content")
+    mailbox.add(GREETING, name="World")
 
     assert mailbox.messages == [
-        Message(kind=Kind.GAME, title="A title", content="Some content")
+        Message(kind=Kind.GAME, title="Hello World", content="Some content")
     ]
 
 
 def test_pop(mailbox):
-    mailbox.add(kind=Kind.GAME, title="A title")
+    mailbox.add(GOING, direction=Direction.NORTH.value)
     assert len(mailbox) == 1
+    assert mailbox[0].title == "Going north"
 
     messages = mailbox.pop()
 
     assert mailbox.messages == []
-    assert messages == [Message(kind=Kind.GAME, title="A title")]
+    assert messages == [Message(kind=Kind.ACTION, title="Going north")]
+
+
+def test_formats_when_read(mailbox):
+    class Name:
+        formatted = 0
+
+        def __format__(self, format_spec):
+            self.formatted += 1
+            return "World"
+
+    name = Name()
+    mailbox.add(GREETING, name=name)
+    assert name.formatted == 0
+
+    assert mailbox[0].title == "Hello World"
+    assert name.formatted == 1
+
+
+def test_plural(mailbox):
+    mailbox.add(LIVES, lives=1)
+    mailbox.add(LIVES, lives=2)
+
+    assert [message.content for message in mailbox.pop()] == [
+        "1 life left",
+        "2 lives left",
+    ]
+
+
+def test_drops_oldest_messages_when_full(mailbox):
+    for i in range(MAILBOX_SIZE + 1):
+        mailbox.add(GREETING, name=i)
+
+    assert len(mailbox) == MAILBOX_SIZE
+    assert mailbox[0].title == "Hello 1"
+
+
+def test_disabled():
+    mailbox = Mailbox(enabled=False)
+
+    mailbox.add(GREETING, name="World")
+
+    assert mailbox.pop() == []
+
+
+def test_clear(mailbox):
+    mailbox.add(GREETING, name="World")
+
+    mailbox.clear()
+
+    assert len(mailbox) == 0
+
+
+def test_messages_are_immutable(mailbox):
+    mailbox.add(GREETING, name="World")
+    message = mailbox.pop()[0]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        message.title = "Another title"  # type: ignore[misc]
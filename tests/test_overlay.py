@@ -0,0 +1,80 @@
+import pytest
+
+from grotten import actions
+from grotten.models import Creature, Item, Location, Overlay
+
+
+@pytest.fixture
+def location():
+    return Location(
+        name="Cellar",
+        description="Damp and cold",
+        creatures=(Creature(name="Rat"), Creature(name="Bat")),
+        items=(Item(name="Candle"),),
+    )
+
+
+@pytest.fixture
+def overlay():
+    return Overlay()
+
+
+def test_reads_from_template(overlay, location):
+    assert overlay.get_creatures(location) == location.creatures
+    assert overlay.get_items(location) == location.items
+    assert overlay.creatures == {}
+    assert overlay.items == {}
+
+
+def test_remove_creature(overlay, location):
+    overlay.remove_creature(location, Creature(name="Rat"))
+
+    assert overlay.get_creatures(location) == (Creature(name="Bat"),)
+    assert len(location.creatures) == 2
+
+
+def test_remove_item(overlay, location):
+    overlay.remove_item(location, Item(name="Candle"))
+
+    assert overlay.get_items(location) == ()
+    assert location.items == (Item(name="Candle"),)
+
+
+def test_add_items(overlay, location):
+    overlay.add_items(location, [Item(name="Key")])
+
+    assert overlay.get_items(location) == (Item(name="Candle"), Item(name="Key"))
+    assert location.items == (Item(name="Candle"),)
+
+
+def test_copy(overlay, location):
+    overlay.remove_item(location, Item(name="Candle"))
+
+    other = overlay.copy()
+    other.add_items(location, [Item(name="Key")])
+
+    assert overlay.get_items(location) == ()
+    assert other.get_items(location) == (Item(name="Key"),)
+
+
+def test_action_table_is_shared_until_changed(overlay, location):
+    assert overlay.get_action_table(location) is location.get_action_table()
+
+    overlay.remove_creature(location, Creature(name="Rat"))
+    table = overlay.get_action_table(location)
+
+    assert table is not location.get_action_table()
+    assert actions.Attack(creature=Creature(name="Rat")) not in table
+    assert actions.Attack(creature=Creature(name="Bat")) in table
+    assert overlay.get_action_table(location) is table
+
+
+def test_changes_invalidate_action_table(overlay, location):
+    overlay.remove_item(location, Item(name="Candle"))
+    assert actions.PickUp(item=Item(name="Candle")) not in overlay.get_action_table(
+        location
+    )
+
+    overlay.add_items(location, [Item(name="Key")])
+
+    assert actions.PickUp(item=Item(name="Key")) in overlay.get_action_table(location)
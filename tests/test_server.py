@@ -0,0 +1,126 @@
+import asyncio
+
+from grotten import server
+from grotten.journal import Replay, read_journal
+
+
+async def start(**kwargs):
+    listener = await server.serve(port=0, **kwargs)
+    host, port = listener.sockets[0].getsockname()[:2]
+    return listener, host, port
+
+
+async def read_turn(reader):
+    lines = []
+    while (line := await reader.readline()) != f"{server.PROMPT}\n".encode():
+        assert line, "Connection closed before the prompt"
+        lines.append(line.decode().rstrip("\n"))
+    return lines
+
+
+async def close(reader, writer):
+    # Wait for the server to end the session as well
+    writer.close()
+    await reader.read()
+
+
+async def choose(reader, writer, label):
+    lines = await read_turn(reader)
+    num = next(line[1:].split("]")[0] for line in lines if line.endswith(f"] {label}"))
+    writer.write(f"{num}\n".encode())
+    await writer.drain()
+    return lines
+
+
+def test_play_session():
+    async def run():
+        listener, host, port = await start()
+        async with listener:
+            reader, writer = await asyncio.open_connection(host, port)
+            first = await choose(reader, writer, "Go west")
+            second = await choose(reader, writer, "Pick up Small Sword")
+            third = await choose(reader, writer, "End game")
+            rest = (await reader.read()).decode()
+            return first, second, third, rest
+
+    first, second, third, rest = asyncio.run(run())
+
+    assert "[location] Entrance" in first
+    assert "[location] Skeletons" in second
+    assert "[action] Picking up Small Sword" in third
+    assert rest == "[game] Welcome back\n\n"
+
+
+def test_invalid_choice_is_asked_again():
+    async def run():
+        listener, host, port = await start()
+        async with listener:
+            reader, writer = await asyncio.open_connection(host, port)
+            actions = await read_turn(reader)
+            writer.write(b"foo\n42\n")
+            first_retry = await read_turn(reader)
+            second_retry = await read_turn(reader)
+            await close(reader, writer)
+            return actions, first_retry, second_retry
+
+    actions, first_retry, second_retry = asyncio.run(run())
+
+    assert "[1] Go north" in actions
+    assert first_retry == second_retry == ["Select 1-4"]
+
+
+def test_concurrent_sessions_are_independent():
+    async def run():
+        listener, host, port = await start()
+        async with listener:
+            a_reader, a_writer = await asyncio.open_connection(host, port)
+            b_reader, b_writer = await asyncio.open_connection(host, port)
+            await choose(a_reader, a_writer, "Go west")
+            await choose(b_reader, b_writer, "Go north")
+            a_turn = await read_turn(a_reader)
+            b_turn = await read_turn(b_reader)
+            await close(a_reader, a_writer)
+            await close(b_reader, b_writer)
+            return a_turn, b_turn
+
+    a_turn, b_turn = asyncio.run(run())
+
+    assert "[location] Skeletons" in a_turn
+    assert "[location] Pit" in b_turn
+
+
+def test_sessions_are_recorded(tmp_path):
+    async def run():
+        listener, host, port = await start(journal_dir=tmp_path)
+        async with listener:
+            reader, writer = await asyncio.open_connection(host, port)
+            await choose(reader, writer, "Go west")
+            await choose(reader, writer, "Pick up Small Sword")
+            await close(reader, writer)
+
+    asyncio.run(run())
+
+    [path] = tmp_path.glob("*.journal")
+    [session] = read_journal(path)
+    game = Replay.from_session(session).game_at(2)
+    assert game.location.name == "Skeletons"
+    assert [item.name for item in game.inventory.items] == ["Small Sword"]
+
+
+def test_switch_locale():
+    async def run():
+        listener, host, port = await start()
+        async with listener:
+            reader, writer = await asyncio.open_connection(host, port)
+            await read_turn(reader)
+            writer.write(b"locale nb_NO\n")
+            turn = await read_turn(reader)
+            await choose(reader, writer, "Gå vestover")
+            after = await read_turn(reader)
+            await close(reader, writer)
+            return turn, after
+
+    turn, after = asyncio.run(run())
+
+    assert turn[0] == "Hva vil du gjøre?"
+    assert "[sted] Skjelett" in after
@@ -0,0 +1,126 @@
+from fractions import Fraction
+
+from grotten import actions
+from grotten.simulation import (
+    GreedyPolicy,
+    OptimalPolicy,
+    RandomPolicy,
+    ScriptedPolicy,
+    Stats,
+    play,
+    simulate,
+    simulate_parallel,
+)
+
+LEVEL_1_SCRIPT = [
+    "Go west",
+    "Pick up Small Sword",
+    "Go north",
+    "Attack Green Dragon",
+    "Go north",
+]
+
+
+def test_scripted_playthrough(game):
+    stats = Stats()
+
+    play(game, ScriptedPolicy(LEVEL_1_SCRIPT), stats)
+
+    assert stats.games == 1
+    assert stats.wins == 1
+    assert stats.turns_to_treasure == {5: 1}
+    assert game.location is game.level.treasure
+
+
+def test_scripted_policy_ends_game_when_script_runs_out(game):
+    stats = Stats()
+
+    play(game, ScriptedPolicy(["Go west"]), stats)
+
+    assert stats.wins == 0
+    assert not game.running
+
+
+def test_deaths_are_counted_where_they_happen(game):
+    stats = Stats()
+
+    play(game, ScriptedPolicy(["Go north"]), stats)
+
+    assert stats.deaths == {"Pit": 1}
+    assert game.location is game.level.start
+
+
+def test_random_policy_never_picks_meta_actions(game):
+    action = RandomPolicy().choose(game, game.available_actions(), 0)
+
+    assert not action.is_meta_action()
+
+
+def test_greedy_policy_picks_up_items(game, level_1):
+    game.location = level_1.locations["skeletons"]
+
+    action = GreedyPolicy().choose(game, game.available_actions(), 0)
+
+    assert isinstance(action, actions.PickUp)
+
+
+def test_greedy_policy_avoids_bad_odds(game, level_1):
+    game.location = level_1.locations["dragon_lair"]
+
+    action = GreedyPolicy().choose(game, game.available_actions(), 0)
+
+    assert isinstance(action, actions.Go)
+
+    action = GreedyPolicy(min_odds=Fraction(1, 4)).choose(
+        game, game.available_actions(), 0
+    )
+
+    assert isinstance(action, actions.Attack)
+
+
+def test_optimal_policy_always_wins(level_1):
+    stats = simulate(level_1, OptimalPolicy(), games=20)
+
+    assert stats.win_rate == 1
+    assert stats.deaths == {}
+
+
+def test_simulate(level_1):
+    stats = simulate(level_1, RandomPolicy(), games=100)
+
+    assert stats.games == 100
+    assert 0 <= stats.wins <= 100
+    assert set(stats.deaths) <= {"Pit", "Dragon lair"}
+    assert sum(stats.turns_to_treasure.values()) == stats.wins
+
+
+def test_merge_stats():
+    stats = Stats(games=2, wins=1)
+    stats.deaths["Pit"] += 1
+    stats.turns_to_treasure[5] += 1
+    other = Stats(games=3, wins=2)
+    other.deaths["Pit"] += 2
+    other.turns_to_treasure[5] += 2
+
+    stats.merge(other)
+
+    assert stats.games == 5
+    assert stats.wins == 3
+    assert stats.win_rate == 0.6
+    assert stats.deaths == {"Pit": 3}
+    assert stats.mean_turns_to_treasure == 5
+
+
+def test_simulate_is_reproducible(level_1):
+    first = simulate(level_1, RandomPolicy(), games=100, seed=7)
+    second = simulate(level_1, RandomPolicy(), games=100, seed=7)
+
+    assert first == second
+
+
+def test_simulate_parallel_matches_single_process(level_1):
+    expected = simulate(level_1, GreedyPolicy(), games=200, seed=3)
+
+    result = simulate_parallel(1, GreedyPolicy(), games=200, seed=3, workers=2)
+
+    assert result == expected
@@ -0,0 +1,80 @@
+import pytest
+
+from grotten import actions, snapshot
+from grotten.enums import Direction
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.models import Item
+
+
+@pytest.fixture
+def played(game):
+    # Pick up the sword, and defeat the dragon so that it leaves its loot
+    actions.GO[Direction.WEST].apply(game)
+    actions.PickUp(item=Item(name="Small Sword", attack_strength=8)).apply(game)
+    actions.GO[Direction.NORTH].apply(game)
+    game.win_fight(game.overlay.get_creatures(game.location)[0])
+    game.die()
+    game.messages.pop()
+    return game
+
+
+def test_round_trip(played, level_1):
+    restored = snapshot.load(snapshot.dump(played))
+
+    assert restored.level is level_1
+    assert restored.location is level_1.locations["dragon_lair"]
+    assert restored.lives == 2
+    assert restored.running
+    assert restored.inventory == played.inventory
+    assert restored.inventory.get_weapon().name == "Small Sword"
+    assert restored.overlay.creatures == played.overlay.creatures
+    assert restored.overlay.items == played.overlay.items
+    assert restored.available_actions() == played.available_actions()
+
+
+def test_round_trip_new_game(game):
+    restored = snapshot.load(snapshot.dump(game))
+
+    assert restored.location is game.location
+    assert restored.inventory == game.inventory
+    assert restored.overlay == game.overlay
+
+
+def test_snapshot_is_compact(played):
+    # The template and its effects are referred to by the level number.
+    assert len(snapshot.dump(played)) < 100
+
+
+def test_round_trip_with_rng(level_1):
+    game = Game.create(level=level_1, seed=42)
+    game.rng.random()
+
+    restored = snapshot.load(snapshot.dump(game, rng=True))
+
+    assert [restored.rng.random() for _ in range(3)] == [
+        game.rng.random() for _ in range(3)
+    ]
+
+
+def test_load_into_given_level(played):
+    level = load_level(1)
+
+    assert snapshot.load(snapshot.dump(played), level=level).level is level
+
+
+def test_load_into_wrong_level(played):
+    with pytest.raises(ValueError, match="for level 1, not level 2"):
+        snapshot.load(snapshot.dump(played), level=load_level(2))
+
+
+def test_load_rejects_other_data():
+    with pytest.raises(ValueError, match="Not a snapshot"):
+        snapshot.load(b"x" * 100)
+
+
+def test_load_rejects_truncated_snapshot(played):
+    data = snapshot.dump(played, rng=True)
+
+    with pytest.raises(ValueError, match="truncated"):
+        snapshot.load(data[:-1])
@@ -0,0 +1,85 @@
+from fractions import Fraction
+
+import pytest
+
+from grotten import actions
+from grotten.enums import Direction
+from grotten.game import Game
+from grotten.levels import load_level
+from grotten.models import Creature, Item, Level, Location
+from grotten.solver import Solver, solve
+
+
+def guarded_level(*, weapon=None):
+    hall = Location(name="Hall", description="A hall", items=weapon or ())
+    guard = Creature(name="Guard", strength=6)
+    treasure = Location(name="Treasure", description="Gold!")
+
+    def open_gate(game):
+        if guard not in game.overlay.get_creatures(game.location):
+            game.location = treasure
+
+    gate = Location(
+        name="Gate",
+        description="A locked gate",
+        creatures=(guard,),
+        actions=(actions.CustomAction("Open the gate", effect=open_gate),),
+    )
+    hall.connect(Direction.NORTH, gate)
+    return Level(
+        number=99,
+        name="Guarded",
+        start=hall,
+        locations={"hall": hall, "gate": gate, "treasure": treasure},
+        treasure=treasure,
+    )
+
+
+@pytest.mark.parametrize("level_number", [1, 2])
+def test_bundled_levels_can_always_be_won(level_number):
+    assert solve(load_level(level_number)).win_probability == 1
+
+
+def test_exact_odds_with_bare_hands():
+    # 3 against 6 is a coin flip, and we have three lives to win it
+    solution = solve(guarded_level())
+
+    assert solution.win_probability == 1 - Fraction(1, 2) ** 3
+
+
+def test_fewer_lives():
+    solution = solve(guarded_level(), lives=1)
+
+    assert solution.win_probability == Fraction(1, 2)
+
+
+def test_picks_up_weapon_first():
+    level = guarded_level(weapon=(Item(name="Axe", attack_strength=6),))
+
+    solution = solve(level)
+
+    assert solution.win_probability == 1
+    game = Game.create(level=level)
+    assert solution.best_action(game) == actions.PickUp(
+        item=Item(name="Axe", attack_strength=6)
+    )
+
+
+def test_follow_optimal_policy():
+    level = guarded_level(weapon=(Item(name="Axe", attack_strength=6),))
+    solver = Solver()
+    game = Game.create(level=level)
+
+    while game.location is not level.treasure:
+        action = solver.best_action(game)
+        assert action is not None
+        action.apply(game)
+
+    assert game.lives == 3
+
+
+def test_unwinnable_level():
+    start = Location(name="Start", description="Nowhere to go")
+    level = Level(number=99, name="Stuck", start=start, treasure=None)
+
+    assert solve(level).win_probability == 0
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+import grotten
+
+# Seconds it may take to import the CLI, measured with `python -X importtime`
+STARTUP_BUDGET = 0.3
+
+FRONTEND_MODULES = {"click", "rich", "typer"}
+SLOW_MODULES = {"concurrent.futures", "importlib.metadata", "rich"}
+
+
+def import_times(module):
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+@pytest.mark.parametrize("module", ["grotten.game", "grotten.simulation"])
+def test_engine_does_not_import_frontend(module):
+    imported = set(import_times(module))
+
+    assert not imported & (FRONTEND_MODULES | SLOW_MODULES)
+
+
+def test_cli_defers_slow_imports():
+    imported = set(import_times("grotten.cli"))
+
+    assert not imported & SLOW_MODULES
+
+
+def test_cli_startup_budget():
+    times = import_times("grotten.cli")
+
+    assert times["grotten.cli"] < STARTUP_BUDGET
+
+
+def test_version_is_looked_up_on_demand():
+    assert grotten.__version__ == "0.1.0"